@@ -1,4 +1,4 @@
-x# Task 1: AI-Powered Code Completion
+# Task 1: AI-Powered Code Completion
 # Comparing Manual vs AI-Suggested Code for Sorting Dictionaries
 
 def manual_sort_dicts_by_key(data_list, key):
@@ -28,90 +28,88 @@ def alternative_ai_approach(data_list, key):
     from operator import itemgetter
     return sorted(data_list, key=itemgetter(key))
 
-# Test data
-test_data = [
-    {"name": "Alice", "age": 30, "city": "New York"},
-    {"name": "Bob", "age": 25, "city": "Los Angeles"},
-    {"name": "Charlie", "age": 35, "city": "Chicago"},
-    {"name": "Diana", "age": 28, "city": "Boston"}
-]
-
-# Testing all implementations
-print("Original data:")
-for item in test_data:
-    print(f"  {item}")
-
-print("\n1. Manual Implementation (by age):")
-manual_result = manual_sort_dicts_by_key(test_data, "age")
-for item in manual_result:
-    print(f"  {item}")
-
-print("\n2. AI-Suggested Implementation (by name):")
-ai_result = ai_suggested_sort_dicts_by_key(test_data, "name")
-for item in ai_result:
-    print(f"  {item}")
-
-print("\n3. Alternative AI Approach (by city):")
-alt_result = alternative_ai_approach(test_data, "city")
-for item in alt_result:
-    print(f"  {item}")
-
-# Performance comparison
-import time
-import random
-
-# Generate larger dataset for performance testing
-large_data = [
-    {"id": i, "value": random.randint(1, 1000), "category": f"cat_{i % 10}"}
-    for i in range(10000)
-]
-
-print(f"\nPerformance Test with {len(large_data)} items:")
-
-# Test manual implementation
-start_time = time.time()
-manual_sort_dicts_by_key(large_data, "value")
-manual_time = time.time() - start_time
-
-# Test AI-suggested implementation
-start_time = time.time()
-ai_suggested_sort_dicts_by_key(large_data, "value")
-ai_time = time.time() - start_time
-
-# Test alternative AI approach
-start_time = time.time()
-alternative_ai_approach(large_data, "value")
-alt_time = time.time() - start_time
-
-print(f"Manual implementation: {manual_time:.6f} seconds")
-print(f"AI-suggested implementation: {ai_time:.6f} seconds")
-print(f"Alternative AI approach: {alt_time:.6f} seconds")
-
-# Analysis
-print("\n" + "="*60)
-print("ANALYSIS: Manual vs AI-Suggested Code Comparison")
-print("="*60)
-
-print("\nManual Implementation:")
-print("- Uses lambda function directly in sorted()")
-print("- More concise, single line")
-print("- Slightly less readable for complex sorting logic")
-print("- Performance: Good")
-
-print("\nAI-Suggested Implementation:")
-print("- Extracts sorting logic into separate function")
-print("- More readable and maintainable")
-print("- Easier to debug and modify")
-print("- Performance: Similar to manual")
-
-print("\nAlternative AI Approach (operator.itemgetter):")
-print("- Uses built-in operator module")
-print("- Most Pythonic and efficient")
-print("- Cleanest syntax")
-print("- Performance: Best (optimized C implementation)")
-
-print("\nCONCLUSION:")
-print("The AI-suggested approaches (especially the operator.itemgetter method)")
-print("provide better code quality, readability, and performance compared to")
-print("the manual lambda approach. AI tools excel at suggesting more")
-print("Pythonic and efficient solutions that developers might not immediately consider.")
+if __name__ == "__main__":
+    # Test data
+    test_data = [
+        {"name": "Alice", "age": 30, "city": "New York"},
+        {"name": "Bob", "age": 25, "city": "Los Angeles"},
+        {"name": "Charlie", "age": 35, "city": "Chicago"},
+        {"name": "Diana", "age": 28, "city": "Boston"}
+    ]
+
+    # Testing all implementations
+    print("Original data:")
+    for item in test_data:
+        print(f"  {item}")
+
+    print("\n1. Manual Implementation (by age):")
+    manual_result = manual_sort_dicts_by_key(test_data, "age")
+    for item in manual_result:
+        print(f"  {item}")
+
+    print("\n2. AI-Suggested Implementation (by name):")
+    ai_result = ai_suggested_sort_dicts_by_key(test_data, "name")
+    for item in ai_result:
+        print(f"  {item}")
+
+    print("\n3. Alternative AI Approach (by city):")
+    alt_result = alternative_ai_approach(test_data, "city")
+    for item in alt_result:
+        print(f"  {item}")
+
+    # Performance comparison: warmed-up, repeated perf_counter_ns timings
+    # (task1_benchmark.py sweeps sizes and key types; this is its 10,000-item int cell)
+    from task1_benchmark import run_benchmarks
+
+    report = run_benchmarks(sizes=[10000], key_types=["int"], repeats=7,
+                            measure_memory=False, verbose=False)
+    by_strategy = {result["strategy"]: result for result in report["results"]}
+
+    print(f"\nPerformance Test with 10000 items (median of {report['meta']['repeats']} runs, IQR):")
+
+    labels = {
+        "manual": "Manual implementation",
+        "ai_suggested": "AI-suggested implementation",
+        "itemgetter": "Alternative AI approach",
+        "columnar": "Columnar NumPy approach",
+        "columnar_lazy": "Columnar NumPy approach (lazy view)"
+    }
+    for name, label in labels.items():
+        result = by_strategy[name]
+        print(f"{label}: {result['median_ns'] / 1e9:.6f} seconds "
+              f"(IQR {result['iqr_ns'] / 1e9:.6f})")
+
+    # Analysis
+    print("\n" + "="*60)
+    print("ANALYSIS: Manual vs AI-Suggested Code Comparison")
+    print("="*60)
+
+    print("\nManual Implementation:")
+    print("- Uses lambda function directly in sorted()")
+    print("- More concise, single line")
+    print("- Slightly less readable for complex sorting logic")
+    print("- Performance: Good")
+
+    print("\nAI-Suggested Implementation:")
+    print("- Extracts sorting logic into separate function")
+    print("- More readable and maintainable")
+    print("- Easier to debug and modify")
+    print("- Performance: Similar to manual")
+
+    print("\nAlternative AI Approach (operator.itemgetter):")
+    print("- Uses built-in operator module")
+    print("- Most Pythonic and efficient")
+    print("- Cleanest syntax")
+    print("- Performance: C-level key extraction; compare medians, single timings are noise-dominated")
+
+    print("\nColumnar NumPy Approach (task1_sorting):")
+    print("- Extracts the key column once into a NumPy array")
+    print("- Stable argsort; small-range integers like 'value' use a radix sort")
+    print("- Can return the permutation or a lazy view instead of a reordered copy")
+    print("- Performance: Dominated by reading the key out of each dict; the sort itself is far cheaper")
+
+    print("\nCONCLUSION:")
+    print("The AI-suggested approaches (especially the operator.itemgetter method)")
+    print("provide better code quality, readability, and performance compared to")
+    print("the manual lambda approach. AI tools excel at suggesting more")
+    print("Pythonic and efficient solutions that developers might not immediately consider.")
@@ -0,0 +1,228 @@
+# Task 1: Sorting Benchmark Harness
+# Repeated, warmed-up timings of every sort strategy across dataset sizes and key types
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import string
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from task1_ai_code_completion import (
+    alternative_ai_approach,
+    ai_suggested_sort_dicts_by_key,
+    manual_sort_dicts_by_key
+)
+from task1_parallel_sort import parallel_sort_dicts_by_key
+from task1_sorting import columnar_sort_dicts_by_key
+
+STRATEGIES = {
+    "manual": manual_sort_dicts_by_key,
+    "ai_suggested": ai_suggested_sort_dicts_by_key,
+    "itemgetter": alternative_ai_approach,
+    "columnar": columnar_sort_dicts_by_key,
+    "columnar_lazy": lambda data_list, key: columnar_sort_dicts_by_key(data_list, key, lazy=True),
+    "parallel": parallel_sort_dicts_by_key
+}
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+KEY_TYPES = ("int", "str", "float", "nearly_sorted")
+
+# Share of positions swapped out of order in the nearly-sorted datasets
+NEARLY_SORTED_SWAPS = 0.01
+
+# A strategy regresses when its median exceeds the baseline median by more
+# than this fraction and lies outside the baseline's interquartile range
+DEFAULT_TOLERANCE = 0.10
+
+
+def make_dataset(size, key_type, seed=0):
+    """Records shaped like the Task 1 demo data, with a ``value`` key of the given type"""
+    rng = random.Random(seed)
+    if key_type == "int":
+        values = [rng.randint(1, 1000) for _ in range(size)]
+    elif key_type == "float":
+        values = [rng.random() * 1000 for _ in range(size)]
+    elif key_type == "str":
+        letters = string.ascii_lowercase
+        values = ["".join(rng.choices(letters, k=8)) for _ in range(size)]
+    elif key_type == "nearly_sorted":
+        values = list(range(size))
+        for _ in range(int(size * NEARLY_SORTED_SWAPS)):
+            i, j = rng.randrange(size), rng.randrange(size)
+            values[i], values[j] = values[j], values[i]
+    else:
+        raise ValueError(f"Unknown key type: {key_type}")
+
+    return [
+        {"id": i, "value": value, "category": f"cat_{i % 10}"}
+        for i, value in enumerate(values)
+    ]
+
+
+def _time_once(func, data_list, key):
+    """One timed call in nanoseconds, with the garbage collector paused"""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        func(data_list, key)
+        return time.perf_counter_ns() - start
+    finally:
+        gc.enable()
+
+
+def _peak_memory(func, data_list, key):
+    """Peak bytes allocated during one call (a separate run; tracemalloc skews timings)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(data_list, key)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def summarize_runs(runs_ns):
+    """Median, quartiles and IQR of a list of timings"""
+    if len(runs_ns) > 1:
+        q1, median, q3 = statistics.quantiles(runs_ns, n=4, method="inclusive")
+    else:
+        q1 = median = q3 = runs_ns[0]
+    return {
+        "median_ns": median,
+        "q1_ns": q1,
+        "q3_ns": q3,
+        "iqr_ns": q3 - q1,
+        "min_ns": min(runs_ns),
+        "max_ns": max(runs_ns),
+        "runs_ns": runs_ns
+    }
+
+
+def benchmark_strategy(name, data_list, key="value", warmup=1, repeats=7, measure_memory=True):
+    """Warm up, then time ``repeats`` calls of one strategy on one dataset"""
+    func = STRATEGIES[name]
+    for _ in range(warmup):
+        func(data_list, key)
+    runs_ns = [_time_once(func, data_list, key) for _ in range(repeats)]
+
+    result = {"strategy": name, **summarize_runs(runs_ns)}
+    result["peak_bytes"] = _peak_memory(func, data_list, key) if measure_memory else None
+    return result
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, key_types=KEY_TYPES, strategies=None, warmup=1,
+                   repeats=7, measure_memory=True, seed=0, verbose=True):
+    """
+    Sweep every strategy over every (size, key type) dataset
+
+    Each strategy's output is checked against ``alternative_ai_approach``
+    before it is timed, so a fast but wrong strategy fails loudly instead of
+    winning. Returns a JSON-ready report.
+    """
+    strategies = list(strategies or STRATEGIES)
+    results = []
+    for size in sizes:
+        for key_type in key_types:
+            data_list = make_dataset(size, key_type, seed=seed)
+            expected = alternative_ai_approach(data_list, "value")
+            for name in strategies:
+                if list(STRATEGIES[name](data_list, "value")) != expected:
+                    raise AssertionError(f"{name} produced a wrong ordering for {key_type} x {size}")
+                result = benchmark_strategy(name, data_list, warmup=warmup, repeats=repeats,
+                                            measure_memory=measure_memory)
+                result.update({"size": size, "key_type": key_type})
+                results.append(result)
+                if verbose:
+                    print(f"{name:>14} {key_type:>13} {size:>10,}: "
+                          f"median {result['median_ns'] / 1e6:10.3f} ms  "
+                          f"IQR {result['iqr_ns'] / 1e6:8.3f} ms"
+                          + (f"  peak {result['peak_bytes'] / 1e6:9.2f} MB" if measure_memory else ""))
+            del data_list, expected
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "warmup": warmup,
+            "repeats": repeats,
+            "seed": seed
+        },
+        "results": results
+    }
+
+
+def compare_results(baseline, current, tolerance=DEFAULT_TOLERANCE):
+    """
+    Regressions of ``current`` against a ``baseline`` report
+
+    A (strategy, key type, size) cell regresses when its median is more than
+    ``tolerance`` above the baseline median and above the baseline's third
+    quartile, so ordinary run-to-run noise does not trip the gate.
+    """
+    def cell(result):
+        return result["strategy"], result["key_type"], result["size"]
+
+    reference = {cell(result): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = reference.get(cell(result))
+        if before is None:
+            continue
+        limit = max(before["median_ns"] * (1 + tolerance), before["q3_ns"])
+        if result["median_ns"] > limit:
+            regressions.append({
+                "strategy": result["strategy"],
+                "key_type": result["key_type"],
+                "size": result["size"],
+                "baseline_median_ns": before["median_ns"],
+                "median_ns": result["median_ns"],
+                "slowdown": result["median_ns"] / before["median_ns"]
+            })
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Task 1 sort strategies")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--key-types", nargs="+", choices=KEY_TYPES, default=list(KEY_TYPES))
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES), default=None)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="earlier --output file to gate regressions against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        sizes=args.sizes,
+        key_types=args.key_types,
+        strategies=args.strategies,
+        warmup=args.warmup,
+        repeats=args.repeats,
+        measure_memory=not args.no_memory,
+        seed=args.seed
+    )
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_results(json.load(f), report, tolerance=args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression['strategy']} {regression['key_type']} "
+                  f"{regression['size']:,}: {regression['slowdown']:.2f}x slower")
+        sys.exit(1 if regressions else 0)
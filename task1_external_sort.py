@@ -0,0 +1,172 @@
+# Task 1: External Merge Sort
+# Sorting JSON Lines exports larger than RAM by a key, with alternative_ai_approach semantics
+
+import argparse
+import heapq
+import json
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from operator import itemgetter
+
+DEFAULT_MEMORY_LIMIT = 256 * 1024 * 1024
+DEFAULT_FAN_IN = 64
+
+# Records are pickled to run files in blocks to keep per-record overhead low;
+# blocks are sized from the memory limit but never below this many raw bytes
+MIN_RUN_BLOCK_BYTES = 64 * 1024
+
+
+def _sort_run(lines, first_seq, key, run_path, block_bytes):
+    """
+    Sort one chunk and spill it to a run file (runs in a worker process)
+
+    Each entry is (key value, input sequence number, raw line): the sequence
+    number breaks ties, which keeps the merge stable and deterministic and
+    means raw lines are never compared.
+    """
+    get_key = itemgetter(key)
+    entries = [(get_key(json.loads(line)), first_seq + offset, line) for offset, line in enumerate(lines)]
+    entries.sort(key=itemgetter(0, 1))
+    _write_run(entries, run_path, block_bytes)
+    return run_path
+
+
+def _write_run(entries, run_path, block_bytes):
+    """Pickle entries in blocks of roughly ``block_bytes`` of raw lines"""
+    with open(run_path, "wb") as f:
+        block, size = [], 0
+        for entry in entries:
+            block.append(entry)
+            size += len(entry[2])
+            if size >= block_bytes:
+                pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+                block, size = [], 0
+        if block:
+            pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _read_run(f):
+    """Stream the entries of a run file block by block"""
+    while True:
+        try:
+            block = pickle.load(f)
+        except EOFError:
+            return
+        yield from block
+
+
+def _merge_runs(run_paths):
+    """k-way heap merge of run files, yielding entries in order"""
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, "rb")) for path in run_paths]
+        yield from heapq.merge(*(_read_run(f) for f in files), key=itemgetter(0, 1))
+
+
+def _read_chunks(stream, chunk_bytes):
+    """Split the input into chunks of roughly ``chunk_bytes`` of raw lines"""
+    chunk, size = [], 0
+    for line in stream:
+        if not line.strip():
+            continue
+        if not line.endswith(b"\n"):
+            line += b"\n"
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield chunk
+            chunk, size = [], 0
+    if chunk:
+        yield chunk
+
+
+def external_sort_jsonl(input_path, output_path, key, memory_limit=DEFAULT_MEMORY_LIMIT,
+                        workers=None, temp_dir=None, fan_in=DEFAULT_FAN_IN):
+    """
+    External implementation: Sort a JSON Lines file of dictionaries by a specific key
+
+    Same ordering as alternative_ai_approach (stable, KeyError on records
+    missing the key), but the input is streamed in chunks bounded by
+    ``memory_limit`` bytes, chunks are sorted in parallel by a process pool
+    and spilled to temporary run files under ``temp_dir``, and the runs are
+    combined by a k-way heap merge (in several passes when there are more
+    than ``fan_in`` runs). Output lines are the input lines, unchanged.
+
+    The merge holds one block per open run plus the block being written,
+    so run blocks are sized to fit ``fan_in + 1`` of them in
+    ``memory_limit``; when that would make blocks smaller than
+    ``MIN_RUN_BLOCK_BYTES``, the fan-in is lowered instead (down to 2).
+    """
+    workers = workers or os.cpu_count() or 1
+    # At most ``workers`` chunks are in flight, plus the one being read
+    chunk_bytes = max(1, memory_limit // (workers + 1))
+    fan_in = max(2, min(fan_in, memory_limit // MIN_RUN_BLOCK_BYTES - 1))
+    block_bytes = max(1, memory_limit // (fan_in + 1))
+    stats = {"records": 0, "runs": 0, "merge_passes": 0, "fan_in": fan_in, "block_bytes": block_bytes}
+
+    with tempfile.TemporaryDirectory(prefix="extsort-", dir=temp_dir) as workdir, \
+            open(input_path, "rb") as source:
+        def sort_jobs():
+            first_seq = 0
+            for index, chunk in enumerate(_read_chunks(source, chunk_bytes)):
+                yield chunk, first_seq, key, os.path.join(workdir, f"run-{index:06d}.bin"), block_bytes
+                first_seq += len(chunk)
+                stats["records"] = first_seq
+
+        if workers == 1:
+            run_paths = [_sort_run(*job) for job in sort_jobs()]
+        else:
+            run_paths = []
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = []
+                for job in sort_jobs():
+                    pending.append(pool.submit(_sort_run, *job))
+                    if len(pending) >= workers:
+                        run_paths.append(pending.pop(0).result())
+                run_paths.extend(future.result() for future in pending)
+        stats["runs"] = len(run_paths)
+
+        # Intermediate passes keep the number of simultaneously open runs bounded
+        generation = 0
+        while len(run_paths) > fan_in:
+            generation += 1
+            merged = []
+            for start in range(0, len(run_paths), fan_in):
+                group = run_paths[start:start + fan_in]
+                merged_path = os.path.join(workdir, f"merge-{generation}-{start // fan_in:06d}.bin")
+                _write_run(_merge_runs(group), merged_path, block_bytes)
+                for path in group:
+                    os.remove(path)
+                merged.append(merged_path)
+            run_paths = merged
+            stats["merge_passes"] += 1
+
+        with open(output_path, "wb") as out:
+            out.writelines(line for _, _, line in _merge_runs(run_paths))
+        stats["merge_passes"] += 1
+
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sort a JSON Lines file by a key, out of core")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--key", required=True)
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_LIMIT // (1024 * 1024))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--temp-dir", default=None)
+    parser.add_argument("--fan-in", type=int, default=DEFAULT_FAN_IN)
+    args = parser.parse_args()
+
+    result = external_sort_jsonl(
+        args.input, args.output, args.key,
+        memory_limit=args.memory_mb * 1024 * 1024,
+        workers=args.workers,
+        temp_dir=args.temp_dir,
+        fan_in=args.fan_in
+    )
+    print(f"Sorted {result['records']} records from {result['runs']} runs "
+          f"in {result['merge_passes']} merge passes")
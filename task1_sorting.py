@@ -0,0 +1,382 @@
+# Task 1: Columnar Sorting Engine
+# Sorting lists of dictionaries by extracting the key column into NumPy once
+
+import bisect
+import heapq
+import math
+from collections.abc import Sequence
+from operator import itemgetter, methodcaller
+
+import numpy as np
+
+# Integer keys spanning at most this many distinct values are sorted as
+# uint8/uint16 offsets, for which NumPy's stable sort is an LSD radix sort
+SMALL_RANGE_LIMIT = 1 << 16
+
+
+# Homogeneous key types that map losslessly onto a native NumPy dtype
+_NATIVE_DTYPES = {int: np.int64, float: np.float64}
+
+
+def extract_key_column(data_list, key):
+    """Pull ``key`` out of every record into a NumPy array (one pass)"""
+    values = list(map(itemgetter(key), data_list))
+    key_types = set(map(type, values))
+    if len(key_types) == 1:
+        dtype = _NATIVE_DTYPES.get(next(iter(key_types)))
+        if dtype is not None:
+            try:
+                return np.fromiter(values, dtype=dtype, count=len(values))
+            except OverflowError:
+                pass  # ints beyond int64 are sorted as Python objects
+
+    # NumPy's U dtype drops trailing NULs ("a\x00" would tie with "a")
+    native_str = key_types == {str} and not any(value.endswith("\x00") for value in values)
+    column = np.array(values) if native_str else None
+    if column is None or column.dtype.kind != "U":
+        # Mixed or non-native keys, and strings U can't hold, keep Python comparison semantics
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+    return column
+
+
+def argsort_column(column):
+    """Stable permutation that sorts ``column``"""
+    if column.dtype.kind in "iu" and len(column):
+        low = column.min()
+        span = int(column.max()) - int(low)
+        if span < SMALL_RANGE_LIMIT:
+            offsets = (column - low).astype(np.uint8 if span < 256 else np.uint16)
+            return np.argsort(offsets, kind="stable")
+    return np.argsort(column, kind="stable")
+
+
+def argsort_dicts_by_key(data_list, key):
+    """Permutation of ``data_list`` ordering it by ``key``, ties in input order"""
+    return argsort_column(extract_key_column(data_list, key))
+
+
+class SortedView(Sequence):
+    """
+    Lazily reordered records
+
+    Holds the original list plus a permutation; records are only fetched
+    when indexed or iterated, so no reordered copy is materialized.
+    """
+
+    __slots__ = ("data", "permutation")
+
+    def __init__(self, data, permutation):
+        self.data = data
+        self.permutation = permutation
+
+    def __len__(self):
+        return len(self.permutation)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SortedView(self.data, self.permutation[index])
+        return self.data[self.permutation[index]]
+
+    def __iter__(self):
+        data = self.data
+        return (data[i] for i in self.permutation.tolist())
+
+    def tolist(self):
+        """Materialize the reordered records"""
+        return list(map(self.data.__getitem__, self.permutation.tolist()))
+
+
+def columnar_sort_dicts_by_key(data_list, key, lazy=False):
+    """
+    Columnar implementation: Sort a list of dictionaries by a specific key
+    Same stable ordering as alternative_ai_approach; with ``lazy=True`` a
+    SortedView is returned instead of a new list
+    """
+    view = SortedView(data_list, argsort_dicts_by_key(data_list, key))
+    return view if lazy else view.tolist()
+
+
+# Multi-key sorting: (key, direction, null placement) specs
+ASCENDING, DESCENDING = "asc", "desc"
+NULLS_FIRST, NULLS_LAST = "first", "last"
+
+
+def normalize_sort_spec(spec):
+    """Accept "key", (key,), (key, direction) or (key, direction, nulls)"""
+    if isinstance(spec, str):
+        spec = (spec,)
+    key, direction, nulls = (tuple(spec) + (ASCENDING, NULLS_LAST)[len(spec) - 1:])[:3]
+    if direction not in (ASCENDING, DESCENDING):
+        raise ValueError(f"direction for {key!r} must be {ASCENDING!r} or {DESCENDING!r}, got {direction!r}")
+    if nulls not in (NULLS_FIRST, NULLS_LAST):
+        raise ValueError(f"null placement for {key!r} must be {NULLS_FIRST!r} or {NULLS_LAST!r}, got {nulls!r}")
+    return key, direction, nulls
+
+
+def _type_group(value):
+    """Order incomparable types by group: numbers, then strings, then by type name"""
+    if isinstance(value, (int, float)):
+        return (0, "")
+    if isinstance(value, str):
+        return (1, "")
+    return (2, type(value).__name__)
+
+
+def _dense_ranks(values):
+    """Dense ranks (0..k-1) of non-null values, equal values sharing a rank"""
+    key_types = set(map(type, values))
+    if key_types <= {int, bool} or key_types == {float} or key_types == {str}:
+        column = np.array(values)
+        if column.dtype.kind in "iufbU":
+            return np.unique(column, return_inverse=True)[1].ravel()
+
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    try:
+        return np.unique(column, return_inverse=True)[1].ravel()
+    except TypeError:
+        pass
+
+    # Heterogeneous keys: rank the type groups, then rank within each group
+    groups = list(map(_type_group, values))
+    group_order = {group: rank for rank, group in enumerate(sorted(set(groups)))}
+    if len(group_order) == 1:
+        # One comparable group already failed to sort: the values are unorderable
+        raise TypeError(f"Key values of type {type(values[0]).__name__!r} cannot be ordered")
+    group_ranks = np.fromiter((group_order[g] for g in groups), dtype=np.int64, count=len(groups))
+    ranks = np.empty(len(values), dtype=np.int64)
+    offset = 0
+    for group, group_rank in sorted(group_order.items(), key=itemgetter(1)):
+        members = np.flatnonzero(group_ranks == group_rank)
+        member_ranks = _dense_ranks([values[i] for i in members])
+        ranks[members] = member_ranks + offset
+        offset += int(member_ranks.max()) + 1
+    return ranks
+
+
+def rank_key_column(data_list, key, direction=ASCENDING, nulls=NULLS_LAST):
+    """
+    Integer sort key for one spec: missing keys and None count as null,
+    descending order flips the ranks, and nulls go before or after all values
+    """
+    values = list(map(methodcaller("get", key), data_list))
+    null_mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+
+    ranks = np.zeros(len(values), dtype=np.int64)
+    if not null_mask.all():
+        present = np.flatnonzero(~null_mask)
+        present_ranks = _dense_ranks([values[i] for i in present])
+        top = int(present_ranks.max())
+        ranks[present] = top - present_ranks if direction == DESCENDING else present_ranks
+        ranks[null_mask] = -1 if nulls == NULLS_FIRST else top + 1
+    return ranks
+
+
+def argsort_dicts_by_keys(data_list, specs):
+    """Stable permutation ordering records by several (key, direction, nulls) specs"""
+    specs = [normalize_sort_spec(spec) for spec in specs]
+    if not specs:
+        raise ValueError("at least one sort spec is required")
+    # np.lexsort treats its last key as the primary one
+    columns = [rank_key_column(data_list, *spec) for spec in reversed(specs)]
+    return np.lexsort(columns)
+
+
+def sort_dicts_by_keys(data_list, specs, lazy=False):
+    """
+    Multi-key implementation: Sort a list of dictionaries by several keys
+    One vectorized lexsort instead of chained sorted() passes; records that
+    lack a key (or hold None) are placed per spec instead of raising KeyError
+    """
+    view = SortedView(data_list, argsort_dicts_by_keys(data_list, specs))
+    return view if lazy else view.tolist()
+
+
+# Partial sorting: top-k and k-th element selection
+
+
+def top_k_dicts_by_key(records, key, k, reverse=False):
+    """
+    First ``k`` records of sorted(records, key=itemgetter(key), reverse=reverse)
+
+    Heap selection in O(n log k) time and O(k) memory; ``records`` may be
+    any iterable, including a stream that never fits in memory. Ties keep
+    their input order exactly as the full stable sort would.
+    """
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    return select(k, records, key=itemgetter(key))
+
+
+def top_k_indices(column, k, reverse=False):
+    """
+    Indices of the first ``k`` entries of a stable (descending when
+    ``reverse``) argsort of ``column``, in order, via argpartition-style
+    selection: O(n) to find the boundary value, then only the k winners
+    are sorted
+    """
+    n = len(column)
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Boundary value of the k-th winner; everything strictly better wins,
+    # and ties on the boundary are won by the earliest records
+    if reverse:
+        boundary = np.partition(column, n - k)[n - k]
+        better = column > boundary
+    else:
+        boundary = np.partition(column, k - 1)[k - 1]
+        better = column < boundary
+    winners = np.flatnonzero(better)
+    ties = np.flatnonzero(column == boundary)[:k - len(winners)]
+    candidates = np.sort(np.concatenate([winners, ties]))
+
+    if reverse:
+        # Stable descending: sort the reversed candidates ascending, then flip
+        flipped = candidates[::-1]
+        return flipped[np.argsort(column[flipped], kind="stable")][::-1]
+    return candidates[np.argsort(column[candidates], kind="stable")]
+
+
+def columnar_top_k_dicts_by_key(data_list, key, k, reverse=False):
+    """Top-k for an in-memory list via the extracted key column"""
+    column = extract_key_column(data_list, key)
+    return [data_list[i] for i in top_k_indices(column, k, reverse).tolist()]
+
+
+def kth_dict_by_key(data_list, key, k, reverse=False):
+    """Record at position ``k`` (0-based) of the full stable sort, without sorting"""
+    if not 0 <= k < len(data_list):
+        raise IndexError("k out of range")
+    column = extract_key_column(data_list, key)
+    n = len(column)
+    position = n - 1 - k if reverse else k
+    boundary = np.partition(column, position)[position]
+    ahead = np.count_nonzero(column > boundary if reverse else column < boundary)
+    return data_list[int(np.flatnonzero(column == boundary)[k - ahead])]
+
+
+class SortedDictIndex:
+    """
+    Sorted index over a dict collection, maintained incrementally
+
+    Replaces repeated ``sorted(data_list, key=itemgetter(key))`` calls when
+    records trickle in: entries live in a list of sorted buckets of bounded
+    size, so insert and delete are a binary search over bucket maxima plus a
+    bisect inside one bucket, and iteration is in order with no re-sort.
+    Ties keep insertion order, matching the stable sort of the same records.
+    Records are tracked by identity, so each dict object can be indexed once.
+    """
+
+    def __init__(self, key, records=(), load=1000):
+        """Index ``records`` (if any) by ``key``; ``load`` sets the bucket size"""
+        self.key = key
+        self.load = load
+        self._get_key = itemgetter(key)
+        self._buckets = []
+        self._maxes = []
+        self._positions = {}
+        self._seq = 0
+        self._len = 0
+        self.update(records)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for bucket in self._buckets:
+            for entry in bucket:
+                yield entry[2]
+
+    def __getitem__(self, index):
+        """Record at a position of the sorted order"""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("index out of range")
+        for bucket in self._buckets:
+            if index < len(bucket):
+                return bucket[index][2]
+            index -= len(bucket)
+
+    def update(self, records):
+        """Insert many records; large batches are merged with a single sort"""
+        records = list(records)
+        ids = set(map(id, records))
+        if len(ids) < len(records) or not ids.isdisjoint(self._positions):
+            raise ValueError("record is already in the index")
+        if len(records) < self.load:
+            for record in records:
+                self.insert(record)
+            return
+
+        # Build the new state aside and swap it in only once the keys are
+        # extracted and sorted, so a KeyError or TypeError leaves the index intact
+        new_entries = [(self._get_key(record), seq, record) for seq, record in enumerate(records, self._seq)]
+        entries = [entry for bucket in self._buckets for entry in bucket] + new_entries
+        entries.sort(key=itemgetter(0, 1))
+        self._positions.update((id(entry[2]), entry[:2]) for entry in new_entries)
+        self._seq += len(records)
+        self._buckets = [entries[i:i + self.load] for i in range(0, len(entries), self.load)]
+        self._maxes = [bucket[-1][:2] for bucket in self._buckets]
+        self._len = len(entries)
+
+    def insert(self, record):
+        """Add one record in O(log n) comparisons (ValueError if already indexed)"""
+        if id(record) in self._positions:
+            raise ValueError("record is already in the index")
+        entry = (self._get_key(record), self._seq, record)
+        probe = entry[:2]
+        if not self._buckets:
+            self._buckets.append([entry])
+            self._maxes.append(probe)
+        else:
+            index = min(bisect.bisect_left(self._maxes, probe), len(self._buckets) - 1)
+            bucket = self._buckets[index]
+            bisect.insort(bucket, entry, key=itemgetter(0, 1))
+            self._maxes[index] = bucket[-1][:2]
+            if len(bucket) > 2 * self.load:
+                self._buckets[index:index + 1] = [bucket[:self.load], bucket[self.load:]]
+                self._maxes[index:index + 1] = [bucket[self.load - 1][:2], bucket[-1][:2]]
+        # Registered only once the entry is in place (a failed comparison changes nothing)
+        self._positions[id(record)] = probe
+        self._seq += 1
+        self._len += 1
+
+    def delete(self, record):
+        """Remove a previously inserted record (by identity)"""
+        probe = self._positions.pop(id(record), None)
+        if probe is None:
+            raise ValueError("record is not in the index")
+        index = bisect.bisect_left(self._maxes, probe)
+        bucket = self._buckets[index]
+        del bucket[bisect.bisect_left(bucket, probe, key=itemgetter(0, 1))]
+        if bucket:
+            self._maxes[index] = bucket[-1][:2]
+        else:
+            del self._buckets[index]
+            del self._maxes[index]
+        self._len -= 1
+
+    def range(self, low=None, high=None, inclusive=(True, True)):
+        """
+        Records with ``low <= record[key] <= high`` in order (either bound
+        may be None; ``inclusive`` toggles each end)
+        """
+        if low is None:
+            index, position = 0, 0
+        else:
+            # (low,) sorts before every (low, seq) and (low, inf) after
+            start = (low,) if inclusive[0] else (low, math.inf)
+            index = bisect.bisect_left(self._maxes, start)
+            if index == len(self._buckets):
+                return
+            position = bisect.bisect_left(self._buckets[index], start, key=itemgetter(0, 1))
+
+        for bucket in self._buckets[index:]:
+            for entry in bucket[position:]:
+                if high is not None and (entry[0] > high or (entry[0] == high and not inclusive[1])):
+                    return
+                yield entry[2]
+            position = 0
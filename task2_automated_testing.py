@@ -2,23 +2,97 @@
 # Using Selenium for Automated Login Page Testing
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 import time
 import json
+from contextlib import contextmanager
 from datetime import datetime
 
+from task2_http_runner import AsyncHTTPLoginRunner, is_reflected
+from task2_page_objects import SessionPageCache, compile_locator
+from task2_parallel_runner import ParallelTestScheduler
+from task2_scenarios import (
+    DEFAULT_FAILURE_LOCATORS,
+    DEFAULT_LOCATORS,
+    DEFAULT_SCENARIO_FILE,
+    batch_cases,
+    expand_scenarios,
+    load_scenarios,
+)
+from task2_result_model import PASSED, TestCaseResult, to_jsonable
+from task2_stats import ResultsAggregate
+from task2_test_selection import case_fingerprint
+from task2_tracing import Tracer
+from task2_waits import AdaptiveWait, block_unneeded_resources
+
+
+def build_chrome_options():
+    """Chrome options shared by every headless test session"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # Run in background
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    
+    # Hand control back at DOMContentLoaded; the waits cover the rest
+    chrome_options.page_load_strategy = "eager"
+    chrome_options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    return chrome_options
+
+
+def create_chrome_driver():
+    """Launch a new headless Chrome session with its own profile"""
+    driver = webdriver.Chrome(options=build_chrome_options())
+    block_unneeded_resources(driver)
+    return driver
+
+
+def _fresh_element_located(locator, previous):
+    """Expected condition: a matching element that was not already on the page"""
+    def condition(driver):
+        for element in driver.find_elements(*locator):
+            if element not in previous:
+                return element
+        return False
+    return condition
+
+
+def _type_into(element, value):
+    element.clear()
+    element.send_keys(value)
+
+
 class AILoginTester:
     """
     AI-Enhanced Automated Testing for Login Pages
     Demonstrates how AI can improve test coverage and reliability
     """
     
-    def __init__(self):
-        """Initialize the AI-powered test framework"""
+    def __init__(self, driver=None, session_pool=None, tracer=None, results_sink=None,
+                 results_store=None, aggregate=None, page_stats=None, metrics=None):
+        """Initialize the AI-powered test framework
+        
+        An existing WebDriver can be passed in (e.g. by the parallel
+        scheduler), or a warm one borrowed from a BrowserSessionPool;
+        otherwise a new headless Chrome session is launched. Step spans
+        go to ``tracer``, which parallel workers share with their parent,
+        and finished cases are streamed to ``results_sink`` when one is set
+        (``results["test_cases"]`` then keeps only the failures).
+        Completed suite runs are recorded in ``results_store`` (history).
+        Summary statistics are kept incrementally in ``aggregate``, which
+        parallel workers also share with their parent, as are the page
+        cache counters in ``page_stats`` and the live ``metrics``
+        (a SuiteMetrics scraped while the suite runs).
+        """
+        self.session_pool = session_pool
+        self.results_sink = results_sink
+        self.results_store = results_store
+        self.tracer = tracer if tracer is not None else Tracer()
+        self.aggregate = aggregate if aggregate is not None else ResultsAggregate()
+        self.metrics = metrics
+        self.test_plan = None
         self.results = {
             "test_cases": [],
             "success_rate": 0,
@@ -26,173 +100,312 @@ class AILoginTester:
             "execution_time": 0
         }
         
-        # Setup Chrome options for headless testing
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run in background
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
         # Initialize WebDriver
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 10)
+            if driver is not None:
+                self.driver = driver
+            elif session_pool is not None:
+                self.driver = session_pool.acquire()
+            else:
+                self.driver = create_chrome_driver()
+            self.wait = AdaptiveWait(self.driver, timeout=10)
         except Exception as e:
             print(f"WebDriver initialization failed: {e}")
             self.driver = None
+        self.pages = SessionPageCache(self.driver, stats=page_stats)
     
-    def test_valid_credentials(self, url, username, password):
-        """Test case: Valid login credentials"""
-        test_case = {
-            "name": "Valid Credentials Test",
-            "status": "FAILED",
-            "error": None,
-            "execution_time": 0
-        }
+    def run_login_case(self, case, navigate=True):
+        """
+        Test case: one declarative login scenario
         
-        start_time = time.time()
+        Fills the fields named in ``case["inputs"]``, submits the form and
+        checks the expected outcome. With ``navigate=False`` the already
+        loaded login page is reused instead of issuing a fresh page load,
+        and every field the previous case may have filled is cleared first.
+        """
+        if self.metrics is not None:
+            self.metrics.case_started()
+        test_case = TestCaseResult(case["name"], wait_time=0, waits=[], steps={}, timestamp=time.time())
         
-        try:
-            # Navigate to login page
-            self.driver.get(url)
-            
-            # Find and fill username field
-            username_field = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
-            )
-            username_field.clear()
-            username_field.send_keys(username)
-            
-            # Find and fill password field
-            password_field = self.driver.find_element(By.NAME, "password")
-            password_field.clear()
-            password_field.send_keys(password)
-            
-            # Submit login form
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-            login_button.click()
-            
-            # Wait for successful login (redirect or dashboard)
-            self.wait.until(
-                EC.url_changes(url)
-            )
-            
-            test_case["status"] = "PASSED"
-            
-        except Exception as e:
-            test_case["error"] = str(e)
+        start_time = time.perf_counter()
+        locators = case["locators"]
+        expect = case["expect"]
+        waits = test_case["waits"]
+        steps = test_case["steps"]
         
-        test_case["execution_time"] = time.time() - start_time
+        with self.tracer.span("case", case=case["name"]):
+            try:
+                # Navigate to login page
+                if navigate:
+                    with self._step(steps, "navigate", url=case["url"]):
+                        self.pages.open(case["url"])
+                
+                # Evidence left behind by a previous case on a reused page
+                previous_outcome = []
+                if not navigate and expect["type"] == "element_visible":
+                    previous_outcome = self.driver.find_elements(*compile_locator(expect["locator"]))
+                
+                # A reused page still holds the previous case's values
+                if not navigate:
+                    for field in sorted(locators.keys() - case["inputs"].keys() - {"submit"}):
+                        with self._step(steps, "type", field=field):
+                            self.pages.perform(locators[field], lambda element: element.clear(),
+                                               self.wait, label=f"locate {field}", record=waits)
+                
+                # Find and fill each input field (handles cached per page)
+                for field, value in case["inputs"].items():
+                    with self._step(steps, "locate", field=field):
+                        field_element = self.pages.find(locators[field], self.wait,
+                                                        label=f"locate {field}", record=waits)
+                    with self._step(steps, "type", field=field):
+                        self.pages.perform(locators[field], lambda element: _type_into(element, value),
+                                           self.wait, label=f"locate {field}", record=waits,
+                                           element=field_element)
+                
+                # Submit login form
+                with self._step(steps, "locate", field="submit"):
+                    login_button = self.pages.find(locators["submit"], self.wait,
+                                                   label="locate submit", record=waits)
+                with self._step(steps, "submit"):
+                    self.pages.perform(locators["submit"], lambda element: element.click(),
+                                       self.wait, label="locate submit", record=waits,
+                                       element=login_button)
+                    self.pages.note_submit()
+                
+                # Any counter-evidence ends the wait early instead of timing out
+                default_fail_fast = DEFAULT_FAILURE_LOCATORS if expect["type"] == "url_changes" else []
+                fail_fast = {
+                    f"{strategy}={value}": EC.visibility_of_element_located(compile_locator((strategy, value)))
+                    for strategy, value in expect.get("fail_fast", default_fail_fast)
+                }
+                
+                with self._step(steps, "await outcome", expect=expect["type"]):
+                    if expect["type"] == "url_changes":
+                        # Wait for successful login (redirect or dashboard)
+                        self.wait.until_any(
+                            {"url_changes": EC.url_changes(case["url"]), **fail_fast},
+                            record=waits, fail_fast=fail_fast
+                        )
+                        test_case["status"] = PASSED
+                    else:
+                        # Wait for a fresh error/validation message
+                        _, outcome_element = self.wait.until_any(
+                            {"outcome": _fresh_element_located(compile_locator(expect["locator"]), previous_outcome),
+                             **fail_fast},
+                            record=waits, fail_fast=fail_fast
+                        )
+                        if outcome_element.is_displayed():
+                            if expect.get("not_reflected") and is_reflected(self.driver.page_source, case["inputs"]):
+                                test_case["error"] = "Input reflected unescaped in page"
+                            else:
+                                test_case["status"] = PASSED
+                
+            except Exception as e:
+                test_case["error"] = str(e)
+        
+        test_case["execution_time"] = time.perf_counter() - start_time
+        test_case["wait_time"] = sum(wait["duration"] for wait in waits)
+        self._record_result(test_case)
         return test_case
     
+    def _record_result(self, test_case):
+        """Fold a finished case into the live aggregate, metrics and results stream"""
+        self.aggregate.add(test_case)
+        if self.metrics is not None:
+            self.metrics.observe(test_case)
+        if self.results_sink is not None:
+            self.results_sink.write(test_case)
+    
+    @contextmanager
+    def _step(self, steps, name, **attrs):
+        """Trace one step and accumulate its duration into the case's breakdown"""
+        span = None
+        try:
+            with self.tracer.span(name, **attrs) as span:
+                yield span
+        finally:
+            if span is not None:
+                steps[name] = steps.get(name, 0) + span["duration_ns"] / 1e9
+    
+    def run_case_batch(self, batch):
+        """Run cases that share a page load, navigating only when needed"""
+        results = []
+        for case in batch:
+            navigate = not results or self.driver is None or not self.pages.can_reuse(case["url"])
+            results.append(self.run_login_case(case, navigate=navigate))
+        return results
+    
+    def test_valid_credentials(self, url, username, password):
+        """Test case: Valid login credentials"""
+        return self.run_login_case({
+            "name": "Valid Credentials Test",
+            "url": url,
+            "locators": DEFAULT_LOCATORS,
+            "inputs": {"username": username, "password": password},
+            "expect": {"type": "url_changes"}
+        })
+    
     def test_invalid_credentials(self, url, username, password):
         """Test case: Invalid login credentials"""
-        test_case = {
+        return self.run_login_case({
             "name": "Invalid Credentials Test",
-            "status": "FAILED",
-            "error": None,
-            "execution_time": 0
-        }
-        
-        start_time = time.time()
-        
-        try:
-            # Navigate to login page
-            self.driver.get(url)
-            
-            # Find and fill username field
-            username_field = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
-            )
-            username_field.clear()
-            username_field.send_keys(username)
-            
-            # Find and fill password field
-            password_field = self.driver.find_element(By.NAME, "password")
-            password_field.clear()
-            password_field.send_keys(password)
-            
-            # Submit login form
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-            login_button.click()
-            
-            # Wait for error message
-            error_element = self.wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, "error-message"))
-            )
-            
-            # Verify error message is displayed
-            if error_element.is_displayed():
-                test_case["status"] = "PASSED"
-            
-        except Exception as e:
-            test_case["error"] = str(e)
-        
-        test_case["execution_time"] = time.time() - start_time
-        return test_case
+            "url": url,
+            "locators": DEFAULT_LOCATORS,
+            "inputs": {"username": username, "password": password},
+            "expect": {"type": "element_visible", "locator": ["class name", "error-message"]}
+        })
     
     def test_empty_fields(self, url):
         """Test case: Empty username and password fields"""
-        test_case = {
+        return self.run_login_case({
             "name": "Empty Fields Test",
-            "status": "FAILED",
-            "error": None,
-            "execution_time": 0
-        }
-        
-        start_time = time.time()
+            "url": url,
+            "locators": DEFAULT_LOCATORS,
+            "inputs": {},
+            "expect": {"type": "element_visible", "locator": ["class name", "validation-error"]}
+        })
+    
+    def build_test_cases(self, test_url, scenario_file=DEFAULT_SCENARIO_FILE):
+        """Expand the scenario file into concrete cases, in suite order"""
+        return list(expand_scenarios(load_scenarios(scenario_file), test_url))
+    
+    def run_test_suite(self, test_url, workers=1, scenario_file=DEFAULT_SCENARIO_FILE,
+                       http_concurrency=50, prioritizer=None, fail_fast=False, impacted_only=False):
+        """Execute complete test suite with AI-enhanced analysis
         
-        try:
-            # Navigate to login page
-            self.driver.get(url)
-            
-            # Submit empty form
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-            login_button.click()
-            
-            # Wait for validation message
-            validation_element = self.wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, "validation-error"))
-            )
-            
-            if validation_element.is_displayed():
-                test_case["status"] = "PASSED"
-                
-        except Exception as e:
-            test_case["error"] = str(e)
+        Cases come from the declarative scenario file and run in order.
+        Scenarios in "http" mode skip the browser and are posted directly by
+        the asyncio fast path; browser cases are batched per page load and,
+        with workers > 1, spread across a pool of headless Chrome sessions.
         
-        test_case["execution_time"] = time.time() - start_time
-        return test_case
-    
-    def run_test_suite(self, test_url):
-        """Execute complete test suite with AI-enhanced analysis"""
+        With a TestPrioritizer, cases run in history-driven order (likely
+        failures first) instead of suite order, and ``impacted_only`` runs
+        just the cases touched by changes or without history. ``fail_fast``
+        stops launching cases after the first failure, ignoring failures of
+        tests the history marks as flaky.
+        """
         print("🚀 Starting AI-Enhanced Automated Testing Suite")
         print("=" * 50)
         
         start_time = time.time()
+        test_cases = self.build_test_cases(test_url, scenario_file)
+        self.results["skipped"] = {"impacted_only": 0, "fail_fast": 0}
+        flaky = set()
+        if prioritizer is not None:
+            self.test_plan = prioritizer.plan(test_cases, impacted_only=impacted_only)
+            test_cases = self.test_plan["cases"]
+            self.results["skipped"]["impacted_only"] = len(self.test_plan["skipped"])
+            flaky = {name for name, estimate in self.test_plan["estimates"].items() if estimate["flaky"]}
+            print(f"Smart ordering: {len(test_cases)} cases, expected time to first failure "
+                  f"{self.test_plan['expected_time_to_first_failure']:.1f}s "
+                  f"(suite order: {self.test_plan['baseline_time_to_first_failure']:.1f}s)")
+        if self.metrics is not None:
+            self.metrics.attach(session_pool=self.session_pool, page_stats=self.pages.stats)
+            self.metrics.enqueue(len(test_cases))
+        on_start = self.metrics.case_started if self.metrics is not None else None
         
-        # Test case 1: Valid credentials
-        print("Testing valid credentials...")
-        valid_test = self.test_valid_credentials(test_url, "testuser", "testpass123")
-        self.results["test_cases"].append(valid_test)
+        def stop_when(batch_results):
+            return fail_fast and any(
+                result["status"] != PASSED and result["name"] not in flaky for result in batch_results
+            )
         
-        # Test case 2: Invalid credentials
-        print("Testing invalid credentials...")
-        invalid_test = self.test_invalid_credentials(test_url, "wronguser", "wrongpass")
-        self.results["test_cases"].append(invalid_test)
+        suite_results = [None] * len(test_cases)
         
-        # Test case 3: Empty fields
-        print("Testing empty fields validation...")
-        empty_test = self.test_empty_fields(test_url)
-        self.results["test_cases"].append(empty_test)
+        # Cases run in (plan) order: each stretch of consecutive cases with the
+        # same mode goes to its path, so the first likely failure is reached
+        # first whichever path it is on
+        segments = []
+        for position, case in enumerate(test_cases):
+            if segments and segments[-1][0] == case["mode"]:
+                segments[-1][1].append(position)
+            else:
+                segments.append((case["mode"], [position]))
         
-        # Calculate results
-        self.results["total_tests"] = len(self.results["test_cases"])
-        passed_tests = sum(1 for test in self.results["test_cases"] if test["status"] == "PASSED")
-        self.results["success_rate"] = (passed_tests / self.results["total_tests"]) * 100
+        runner = AsyncHTTPLoginRunner(concurrency=http_concurrency)
+        scheduler = ParallelTestScheduler(
+            workers=workers,
+            tester_factory=self._spawn_worker_tester
+        ) if workers > 1 else None
+        page_loads = 0
+        try:
+            for mode, positions in segments:
+                if stop_when([result for result in suite_results if result is not None]):
+                    break
+                cases = [test_cases[i] for i in positions]
+                
+                if mode == "http":
+                    # HTTP fast path
+                    print(f"Running {len(cases)} test cases on the HTTP fast path...")
+                    segment_results = runner.run(cases, on_result=self._record_result, on_start=on_start,
+                                                 stop_when=lambda result: stop_when([result]))
+                    for position, result in zip(positions, segment_results):
+                        suite_results[position] = result
+                    continue
+                
+                # Browser path
+                batches = batch_cases(cases)
+                if scheduler is not None:
+                    print(f"Running {len(cases)} test cases on {workers} parallel browser sessions...")
+                    browser_results = scheduler.run([("run_case_batch", (batch,)) for batch in batches],
+                                                    stop_when=stop_when, shutdown=False)
+                else:
+                    print(f"Running {len(cases)} test cases in {len(batches)} page loads...")
+                    browser_results = []
+                    for batch in batches:
+                        if page_loads and self.session_pool is not None:
+                            # Start each batch from a clean session, without relaunching
+                            self.session_pool.reset_session(self.driver)
+                        page_loads += 1
+                        browser_results.append(self.run_case_batch(batch))
+                        if stop_when(browser_results[-1]):
+                            break
+                flat_results = (
+                    result
+                    for batch, batch_results in zip(batches, browser_results)
+                    for result in (batch_results if batch_results is not None else [None] * len(batch))
+                )
+                for position, result in zip(positions, flat_results):
+                    suite_results[position] = result
+        finally:
+            if scheduler is not None:
+                scheduler.shutdown()
+        
+        executed = [result for result in suite_results if result is not None]
+        self.results["skipped"]["fail_fast"] = len(suite_results) - len(executed)
+        if self.metrics is not None:
+            self.metrics.dequeue(self.results["skipped"]["fail_fast"])
+        if self.results["skipped"]["fail_fast"]:
+            print(f"Fail-fast: skipped {self.results['skipped']['fail_fast']} test cases after a failure")
+        if self.results_sink is None:
+            self.results["test_cases"].extend(executed)
+        else:
+            # Every record is already in the stream; keep only failures for the report
+            self.results["test_cases"].extend(result for result in executed if result["status"] != PASSED)
+        
+        # Calculate results (already aggregated as each case finished)
+        self.results["total_tests"] = self.aggregate.total
+        self.results["success_rate"] = self.aggregate.success_rate
         self.results["execution_time"] = time.time() - start_time
+        self.results["statistics"] = self.aggregate.to_dict()
+        
+        if self.results_store is not None:
+            executed_names = {result["name"] for result in executed}
+            self.results_store.ingest_run(self.results, suite="login", test_cases=executed, fingerprints={
+                case["name"]: case_fingerprint(case) for case in test_cases if case["name"] in executed_names
+            })
         
         return self.results
     
+    def _spawn_worker_tester(self):
+        """Build a tester for a parallel worker, sharing this tester's pool"""
+        if self.session_pool is not None:
+            return AILoginTester(session_pool=self.session_pool, tracer=self.tracer,
+                                 results_sink=self.results_sink, aggregate=self.aggregate,
+                                 page_stats=self.pages.stats, metrics=self.metrics)
+        return AILoginTester(driver=create_chrome_driver(), tracer=self.tracer,
+                             results_sink=self.results_sink, aggregate=self.aggregate,
+                             page_stats=self.pages.stats, metrics=self.metrics)
+    
     def generate_ai_insights(self):
         """Generate AI-powered insights from test results"""
         insights = {
@@ -210,19 +423,71 @@ class AILoginTester:
             insights["coverage_analysis"] = "Test coverage needs significant improvement"
         
         # Performance analysis
-        avg_execution_time = sum(test["execution_time"] for test in self.results["test_cases"]) / self.results["total_tests"]
-        insights["performance_metrics"] = f"Average test execution time: {avg_execution_time:.2f} seconds"
+        avg_execution_time = self.aggregate.execution_time.mean
+        avg_wait_time = self.aggregate.wait_time.mean
+        wait_share = (avg_wait_time / avg_execution_time * 100) if avg_execution_time else 0
+        insights["performance_metrics"] = (
+            f"Average test execution time: {avg_execution_time:.2f} seconds "
+            f"(p95 {self.aggregate.quantile(0.95):.2f}s; "
+            f"{avg_wait_time:.2f}s / {wait_share:.0f}% spent waiting)"
+        )
+        
+        # Where the suite actually spends its time
+        insights["slowest_steps"] = self.aggregate.slowest_steps()
+        if insights["slowest_steps"]:
+            slowest = insights["slowest_steps"][0]
+            insights["performance_metrics"] += (
+                f"; slowest step: {slowest['step']} "
+                f"(mean {slowest['mean']:.2f}s, {slowest['share']:.0f}% of step time)"
+            )
+        
+        # Risk grounded in the history of these tests, not just this run
+        if self.results_store is not None:
+            insights["risk_assessment"] = self.results_store.assess_risk(sorted(self.aggregate.names), suite="login")
+        
+        # Browser startup amortization
+        if self.session_pool is not None:
+            insights["session_pool"] = self.session_pool.stats()
+        
+        # WebDriver round-trips saved by cached element handles and reused pages
+        insights["page_cache"] = self.pages.stats.to_dict()
         
         # AI-generated recommendations
         if self.results["success_rate"] < 100:
             insights["recommendations"].append("Implement additional edge case testing")
             insights["recommendations"].append("Add visual regression testing for UI consistency")
-            insights["recommendations"].append("Consider implementing parallel test execution for faster feedback")
+            if self.test_plan is None:
+                insights["recommendations"].append(
+                    "Run likely failures first with history-based ordering (TestPrioritizer) for faster feedback"
+                )
+        
+        # Time-to-first-failure gained from history-driven ordering and selection
+        if self.test_plan is not None:
+            insights["test_selection"] = {
+                "baseline_time_to_first_failure": self.test_plan["baseline_time_to_first_failure"],
+                "expected_time_to_first_failure": self.test_plan["expected_time_to_first_failure"],
+                "expected_time_saved": self.test_plan["expected_time_saved"],
+                "skipped_tests": len(self.test_plan["skipped"]),
+                "skipped_time": self.test_plan["skipped_time"]
+            }
+            insights["recommendations"].append(
+                f"Smart ordering saves an expected {self.test_plan['expected_time_saved']:.1f}s "
+                f"to first failure; skipping unimpacted tests saves {self.test_plan['skipped_time']:.1f}s"
+            )
         
         return insights
     
     def save_results(self, filename="test_results.json"):
-        """Save test results and AI insights to file"""
+        """Save test results and AI insights to file
+        
+        When results are being streamed, the per-test records are already on
+        disk; only the compact summary with the insights is appended.
+        """
+        if self.results_sink is not None:
+            self.results_sink.close(summary={"ai_insights": self.generate_ai_insights()})
+            print(f"Results streamed to {self.results_sink.filename}")
+            return
+        
         results_with_insights = {
             "test_results": self.results,
             "ai_insights": self.generate_ai_insights(),
@@ -230,14 +495,28 @@ class AILoginTester:
         }
         
         with open(filename, 'w') as f:
-            json.dump(results_with_insights, f, indent=2)
+            json.dump(results_with_insights, f, indent=2, default=to_jsonable)
         
         print(f"Results saved to {filename}")
     
+    def save_trace(self, filename="test_trace.json", spans_filename=None):
+        """Export step spans as a Chrome trace (and optionally as raw JSON spans)"""
+        self.tracer.export_chrome_trace(filename)
+        if spans_filename:
+            self.tracer.export_json(spans_filename)
+        print(f"Trace saved to {filename}")
+    
     def cleanup(self):
-        """Clean up resources"""
+        """Clean up resources
+        
+        Pooled sessions are handed back to stay warm for the next suite.
+        """
         if self.driver:
-            self.driver.quit()
+            if self.session_pool is not None:
+                self.session_pool.release(self.driver)
+            else:
+                self.driver.quit()
+            self.driver = None
 
 # Demo execution (commented out for safety - requires actual website)
 if __name__ == "__main__":
@@ -6,14 +6,40 @@ import json
 from datetime import datetime
 import random
 
+from task2_scenarios import DEFAULT_SCENARIO_FILE, load_scenarios
+from task2_result_model import FAILED, PASSED, RunEnvironment, TestCaseResult, to_jsonable
+from task2_stats import ResultsAggregate
+from task2_tracing import STEP_NAMES
+
 class AITestingDemo:
     """
     Demo version of the AI-Enhanced Automated Testing Framework
     Simulates test execution and AI insights generation
     """
     
-    def __init__(self):
-        """Initialize the demo testing framework"""
+    def __init__(self, scenario_file=DEFAULT_SCENARIO_FILE, processing_delay=0.0, results_sink=None,
+                 results_store=None, metrics=None):
+        """Initialize the demo testing framework
+        
+        ``processing_delay`` adds a real sleep per simulated test, for
+        presentations that want visible pacing; by default nothing blocks.
+        Finished tests are streamed to ``results_sink`` when one is set (only
+        failures are then kept in ``results["test_cases"]``), and completed
+        runs are recorded in ``results_store`` (history). Progress
+        is reported live through ``metrics`` (a SuiteMetrics) when given.
+        """
+        self.processing_delay = processing_delay
+        self.results_sink = results_sink
+        self.results_store = results_store
+        self.metrics = metrics
+        self.aggregate = ResultsAggregate()
+        
+        # Realistic test details, shared by every result of this run
+        self.environment = RunEnvironment(
+            browser="Chrome 120.0.6099.109",
+            platform="Windows 10",
+            viewport="1920x1080"
+        )
         self.results = {
             "test_cases": [],
             "success_rate": 0,
@@ -21,48 +47,26 @@ class AITestingDemo:
             "execution_time": 0
         }
         
-        # Simulated test data
-        self.test_scenarios = [
-            {
-                "name": "Valid Credentials Test",
-                "description": "Test login with valid username and password",
-                "expected_result": "Successful login and redirect to dashboard"
-            },
-            {
-                "name": "Invalid Credentials Test", 
-                "description": "Test login with incorrect username/password",
-                "expected_result": "Error message displayed, user remains on login page"
-            },
-            {
-                "name": "Empty Fields Validation",
-                "description": "Test form submission with empty username and password",
-                "expected_result": "Validation error messages displayed for both fields"
-            },
-            {
-                "name": "SQL Injection Prevention",
-                "description": "Test login form against SQL injection attempts",
-                "expected_result": "Form safely handles malicious input without errors"
-            },
-            {
-                "name": "XSS Prevention Test",
-                "description": "Test form against cross-site scripting attempts",
-                "expected_result": "Script tags are properly escaped or rejected"
-            }
-        ]
+        # Scenarios are shared with the Selenium suite's declarative scenario file
+        self.test_scenarios = load_scenarios(scenario_file)
     
     def simulate_test_execution(self, test_name, success_probability=0.9):
         """Simulate test execution with realistic timing and results"""
         
-        test_case = {
-            "name": test_name,
-            "status": "PASSED" if random.random() < success_probability else "FAILED",
-            "error": None,
-            "execution_time": random.uniform(0.5, 3.0),
-            "details": {}
-        }
+        test_case = TestCaseResult(
+            test_name,
+            status=PASSED if random.random() < success_probability else FAILED,
+            execution_time=random.uniform(0.5, 3.0),
+            wait_time=0,
+            waits=[],
+            steps={},
+            timestamp=time.time(),
+            environment=self.environment
+        )
         
         # Simulate test execution
-        time.sleep(0.1)  # Simulate processing time
+        if self.processing_delay:
+            time.sleep(self.processing_delay)
         
         if test_case["status"] == "FAILED":
             test_case["error"] = random.choice([
@@ -72,12 +76,25 @@ class AITestingDemo:
                 "Network connection timeout"
             ])
         
-        # Add realistic test details
-        test_case["details"] = {
-            "browser": "Chrome 120.0.6099.109",
-            "platform": "Windows 10",
-            "viewport": "1920x1080",
-            "timestamp": datetime.now().isoformat()
+        # Simulated wait telemetry: part of every run is spent waiting on the page
+        wait_budget = test_case["execution_time"] * random.uniform(0.3, 0.7)
+        shares = [random.random() for _ in range(3)]
+        for condition, share in zip(["locate username", "locate submit", "outcome"], shares):
+            test_case["waits"].append({
+                "condition": condition,
+                "duration": wait_budget * share / sum(shares),
+                "polls": random.randint(1, 8),
+                "outcome": "met"
+            })
+        if test_case["status"] == "FAILED":
+            test_case["waits"][-1]["outcome"] = "timeout"
+        test_case["wait_time"] = wait_budget
+        
+        # Simulated per-step breakdown of the execution time
+        weights = [random.random() for _ in STEP_NAMES]
+        test_case["steps"] = {
+            step: test_case["execution_time"] * weight / sum(weights)
+            for step, weight in zip(STEP_NAMES, weights)
         }
         
         return test_case
@@ -90,6 +107,10 @@ class AITestingDemo:
         print("=" * 60)
         
         start_time = time.time()
+        # Streamed runs keep per-case records only as long as the history store needs them
+        history = [] if self.results_sink is not None and self.results_store is not None else None
+        if self.metrics is not None:
+            self.metrics.enqueue(len(self.test_scenarios))
         
         # Execute all test scenarios
         for scenario in self.test_scenarios:
@@ -97,21 +118,35 @@ class AITestingDemo:
             print(f"   Description: {scenario['description']}")
             print(f"   Expected: {scenario['expected_result']}")
             
+            if self.metrics is not None:
+                self.metrics.case_started()
             test_result = self.simulate_test_execution(scenario['name'])
-            self.results["test_cases"].append(test_result)
+            if self.results_sink is None or test_result["status"] != PASSED:
+                self.results["test_cases"].append(test_result)
+            if history is not None:
+                history.append(test_result)
+            self.aggregate.add(test_result)
+            if self.metrics is not None:
+                self.metrics.observe(test_result)
+            if self.results_sink is not None:
+                self.results_sink.write(test_result)
             
             status_icon = "✅" if test_result["status"] == "PASSED" else "❌"
             print(f"   Result: {status_icon} {test_result['status']}")
-            print(f"   Execution Time: {test_result['execution_time']:.2f}s")
+            print(f"   Execution Time: {test_result['execution_time']:.2f}s "
+                  f"(waiting: {test_result['wait_time']:.2f}s)")
             
             if test_result["error"]:
                 print(f"   Error: {test_result['error']}")
         
         # Calculate results
-        self.results["total_tests"] = len(self.results["test_cases"])
-        passed_tests = sum(1 for test in self.results["test_cases"] if test["status"] == "PASSED")
-        self.results["success_rate"] = (passed_tests / self.results["total_tests"]) * 100
+        self.results["total_tests"] = self.aggregate.total
+        self.results["success_rate"] = self.aggregate.success_rate
         self.results["execution_time"] = time.time() - start_time
+        self.results["statistics"] = self.aggregate.to_dict()
+        
+        if self.results_store is not None:
+            self.results_store.ingest_run(self.results, suite="demo", test_cases=history)
         
         return self.results
     
@@ -134,13 +169,29 @@ class AITestingDemo:
             insights["coverage_analysis"] = "Test coverage needs significant improvement - critical gaps identified"
         
         # Performance analysis
-        avg_execution_time = sum(test["execution_time"] for test in self.results["test_cases"]) / self.results["total_tests"]
-        insights["performance_metrics"] = f"Average test execution time: {avg_execution_time:.2f} seconds"
+        avg_execution_time = self.aggregate.execution_time.mean
+        avg_wait_time = self.aggregate.wait_time.mean
+        wait_share = (avg_wait_time / avg_execution_time * 100) if avg_execution_time else 0
+        insights["performance_metrics"] = (
+            f"Average test execution time: {avg_execution_time:.2f} seconds "
+            f"(p95 {self.aggregate.quantile(0.95):.2f}s; "
+            f"{avg_wait_time:.2f}s / {wait_share:.0f}% spent waiting)"
+        )
+        
+        # Where the suite actually spends its time
+        insights["slowest_steps"] = self.aggregate.slowest_steps()
+        if insights["slowest_steps"]:
+            slowest = insights["slowest_steps"][0]
+            insights["performance_metrics"] += (
+                f"; slowest step: {slowest['step']} "
+                f"(mean {slowest['mean']:.2f}s, {slowest['share']:.0f}% of step time)"
+            )
         
         # Risk assessment
-        failed_tests = [test for test in self.results["test_cases"] if test["status"] == "FAILED"]
-        if failed_tests:
-            insights["risk_assessment"] = f"High risk: {len(failed_tests)} critical test failures detected"
+        if self.results_store is not None:
+            insights["risk_assessment"] = self.results_store.assess_risk(sorted(self.aggregate.names), suite="demo")
+        elif self.aggregate.failed:
+            insights["risk_assessment"] = f"High risk: {self.aggregate.failed} critical test failures detected"
         else:
             insights["risk_assessment"] = "Low risk: All tests passed successfully"
         
@@ -171,13 +222,16 @@ class AITestingDemo:
         # Test Results Summary
         print(f"\n🎯 TEST RESULTS SUMMARY")
         print(f"   Total Tests Executed: {self.results['total_tests']}")
-        print(f"   Tests Passed: {sum(1 for test in self.results['test_cases'] if test['status'] == 'PASSED')}")
-        print(f"   Tests Failed: {sum(1 for test in self.results['test_cases'] if test['status'] == 'FAILED')}")
+        print(f"   Tests Passed: {self.aggregate.passed}")
+        print(f"   Tests Failed: {self.aggregate.failed}")
         print(f"   Success Rate: {self.results['success_rate']:.1f}%")
         print(f"   Total Execution Time: {self.results['execution_time']:.2f} seconds")
         
-        # Detailed Test Results
-        print(f"\n📋 DETAILED TEST RESULTS")
+        # Detailed Test Results (only failures are kept when streaming)
+        if self.results_sink is None:
+            print(f"\n📋 DETAILED TEST RESULTS")
+        else:
+            print(f"\n📋 FAILED TESTS (every result is in {self.results_sink.filename})")
         print("-" * 80)
         for i, test in enumerate(self.results["test_cases"], 1):
             status_icon = "✅" if test["status"] == "PASSED" else "❌"
@@ -194,6 +248,8 @@ class AITestingDemo:
         print("-" * 80)
         print(f"Coverage Analysis: {ai_insights['coverage_analysis']}")
         print(f"Performance Metrics: {ai_insights['performance_metrics']}")
+        for step in ai_insights['slowest_steps']:
+            print(f"   Slow step: {step['step']} - mean {step['mean']:.2f}s, max {step['max']:.2f}s")
         print(f"Risk Assessment: {ai_insights['risk_assessment']}")
         
         print(f"\n💡 Key Recommendations:")
@@ -205,7 +261,16 @@ class AITestingDemo:
             print(f"   {i}. {step}")
     
     def save_demo_results(self, filename="demo_test_results.json"):
-        """Save demo results and AI insights to file"""
+        """Save demo results and AI insights to file
+        
+        When results are being streamed, only the compact summary with the
+        insights is appended to the stream.
+        """
+        if self.results_sink is not None:
+            self.results_sink.close(summary={"ai_insights": self.generate_ai_insights(), "mode": "Simulation"})
+            print(f"\n💾 Demo results streamed to {self.results_sink.filename}")
+            return
+        
         results_with_insights = {
             "test_results": self.results,
             "ai_insights": self.generate_ai_insights(),
@@ -217,7 +282,7 @@ class AITestingDemo:
         }
         
         with open(filename, 'w') as f:
-            json.dump(results_with_insights, f, indent=2)
+            json.dump(results_with_insights, f, indent=2, default=to_jsonable)
         
         print(f"\n💾 Demo results saved to {filename}")
         print("   You can use this file to demonstrate the framework's capabilities")
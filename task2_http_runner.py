@@ -0,0 +1,252 @@
+# Task 2: HTTP Fast Path for Login Checks
+# Posts login forms directly with asyncio instead of driving a browser
+
+import asyncio
+import re
+import ssl
+import time
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from task2_result_model import PASSED, TestCaseResult
+
+# Responses that end at the blank line after the headers (RFC 9112, 6.3)
+BODILESS_STATUSES = (204, 304)
+
+
+class HTTPResponse:
+    """Minimal parsed HTTP response"""
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def text(self):
+        return self.body.decode("utf-8", errors="replace")
+
+
+class AsyncHTTPLoginRunner:
+    """
+    Runs login scenarios at the HTTP level
+
+    Suited to checks that need no JavaScript: server-side validation,
+    invalid-credential error pages and injection payload sweeps. Keep-alive
+    connections are pooled per origin and ``concurrency`` bounds the number
+    of requests in flight.
+    """
+
+    def __init__(self, concurrency=50, timeout=10):
+        """Configure request concurrency and the per-request timeout (seconds)"""
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._idle = {}
+        self.counters = {"connections_opened": 0, "requests": 0}
+
+    def run(self, cases, on_result=None, on_start=None, stop_when=None):
+        """Execute cases and return their results in input order"""
+        return asyncio.run(self.run_cases(cases, on_result, on_start, stop_when))
+
+    async def run_cases(self, cases, on_result=None, on_start=None, stop_when=None):
+        """
+        Async entry point; results keep the order of ``cases``
+
+        ``on_start`` is called with each case once it gets a concurrency
+        slot, and ``on_result`` with each test case as soon as it finishes.
+        When ``stop_when(test_case)`` is true for a finished case, cases that
+        have not started yet are skipped and their results left as None.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        stopped = False
+
+        async def bounded(case):
+            nonlocal stopped
+            async with semaphore:
+                if stopped:
+                    return None
+                if on_start is not None:
+                    on_start(case)
+                test_case = await self.run_case(case)
+            if on_result is not None:
+                on_result(test_case)
+            if stop_when is not None and stop_when(test_case):
+                stopped = True
+            return test_case
+
+        try:
+            return await asyncio.gather(*(bounded(case) for case in cases))
+        finally:
+            await self.close()
+
+    async def run_case(self, case):
+        """Test case: post the login form and assert on the response"""
+        test_case = TestCaseResult(case["name"], steps={}, timestamp=time.time())
+
+        start_time = time.perf_counter()
+        expect = case["expect"]
+
+        try:
+            action = urljoin(case["url"], case.get("action", ""))
+            response = await asyncio.wait_for(
+                self.post_form(action, form_fields(case)), self.timeout
+            )
+            test_case["steps"]["submit"] = time.perf_counter() - start_time
+
+            if expect["type"] == "url_changes":
+                location = response.headers.get("location")
+                if 300 <= response.status < 400 and location and urljoin(action, location) != case["url"]:
+                    test_case["status"] = PASSED
+                else:
+                    test_case["error"] = f"Expected redirect away from login page, got HTTP {response.status}"
+            else:
+                body = response.text
+                if not response_has_element(body, expect["locator"]):
+                    test_case["error"] = f"Expected element {expect['locator']} not found in HTTP {response.status} response"
+                elif expect.get("not_reflected") and is_reflected(body, case["inputs"]):
+                    test_case["error"] = "Input reflected unescaped in response"
+                else:
+                    test_case["status"] = PASSED
+
+        except asyncio.TimeoutError:
+            test_case["error"] = f"Timeout after {self.timeout}s waiting for {case['url']}"
+        except Exception as e:
+            test_case["error"] = str(e) or type(e).__name__
+
+        test_case["execution_time"] = time.perf_counter() - start_time
+        return test_case
+
+    async def post_form(self, url, fields):
+        """POST an urlencoded form over a pooled keep-alive connection"""
+        parts = urlsplit(url)
+        secure = parts.scheme == "https"
+        port = parts.port or (443 if secure else 80)
+        origin = (parts.hostname, port, secure)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        payload = urlencode(fields).encode()
+        request = (
+            f"POST {path} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            "Content-Type: application/x-www-form-urlencoded\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: keep-alive\r\n"
+            "\r\n"
+        ).encode() + payload
+
+        # A pooled connection may have been closed by the server while idle;
+        # retry once on a fresh connection in that case
+        for attempt in range(2):
+            reader, writer, reused = await self._acquire(origin)
+            try:
+                writer.write(request)
+                await writer.drain()
+                response, keep_alive = await _read_response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            self.counters["requests"] += 1
+            if keep_alive:
+                self._idle.setdefault(origin, []).append((reader, writer))
+            else:
+                writer.close()
+            return response
+
+    async def _acquire(self, origin):
+        """Take an idle connection for the origin or open a new one"""
+        idle = self._idle.get(origin)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        host, port, secure = origin
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=ssl.create_default_context() if secure else None
+        )
+        self.counters["connections_opened"] += 1
+        return reader, writer, False
+
+    async def close(self):
+        """Close every pooled connection"""
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for _, writer in connections:
+                writer.close()
+
+
+async def _read_response(reader):
+    """Read one HTTP/1.1 response; returns (response, connection reusable)"""
+    status_line = await reader.readuntil(b"\r\n")
+    _, status, _ = status_line.decode("latin-1").split(" ", 2)
+
+    headers = {}
+    while True:
+        line = await reader.readuntil(b"\r\n")
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    status = int(status)
+    keep_alive = headers.get("connection", "").lower() != "close"
+    if status in BODILESS_STATUSES or 100 <= status < 200:
+        # These never carry a body, whatever the headers say
+        body = b""
+    elif headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0:
+                await reader.readuntil(b"\r\n")
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        keep_alive = False
+
+    return HTTPResponse(status, headers, body), keep_alive
+
+
+def form_fields(case):
+    """Map a case's inputs onto form field names taken from By.NAME locators"""
+    fields = {}
+    for field, locator in case["locators"].items():
+        if field == "submit":
+            continue
+        if locator[0] != "name":
+            raise ValueError(f"HTTP fast path needs a 'name' locator for field {field!r}, got {locator[0]!r}")
+        fields[locator[1]] = case["inputs"].get(field, "")
+    return fields
+
+
+def response_has_element(body, locator):
+    """Check the raw HTML for an element matching a class name or id locator"""
+    strategy, value = locator
+    if strategy == "class name":
+        pattern = r"""class\s*=\s*["'](?:[^"']*\s)?%s(?:\s[^"']*)?["']"""
+    elif strategy == "id":
+        pattern = r"""id\s*=\s*["']%s["']"""
+    else:
+        raise ValueError(f"HTTP fast path cannot evaluate {strategy!r} locators")
+    return re.search(pattern % re.escape(value), body) is not None
+
+
+def is_reflected(body, inputs):
+    """True if any markup-bearing input appears verbatim in the response"""
+    return any(value and "<" in value and value in body for value in inputs.values())
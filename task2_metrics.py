@@ -0,0 +1,224 @@
+# Task 2: Live Suite Metrics
+# Progress counters for long-running suites, served in Prometheus text format or written as snapshots
+
+import argparse
+import bisect
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds (seconds) of the execution-time histogram buckets
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class SuiteMetrics:
+    """
+    Live counters for one test suite
+
+    The hot path is three calls: ``enqueue(n)`` when cases are scheduled,
+    ``case_started()`` and ``observe(test_case)`` when one finishes. Each is
+    a few integer updates under an uncontended lock. Everything derived
+    (rates, queue depth, busy workers, session reuse) is computed only
+    when a scrape or snapshot asks for it.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, namespace="login_suite"):
+        """Start the clock; sources such as the session pool are attached later"""
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.execution_time_sum = 0.0
+        self.enqueued = 0
+        self.started = 0
+        self.passed = 0
+        self.failed = 0
+        self.started_at = time.time()
+        self.session_pool = None
+        self.page_stats = None
+        self._lock = threading.Lock()
+
+    def attach(self, session_pool=None, page_stats=None):
+        """Report session reuse from a BrowserSessionPool and a PageCacheStats"""
+        if session_pool is not None:
+            self.session_pool = session_pool
+        if page_stats is not None:
+            self.page_stats = page_stats
+
+    def enqueue(self, count):
+        with self._lock:
+            self.enqueued += count
+
+    def dequeue(self, count):
+        """Cases that were scheduled but will not run (e.g. skipped by fail-fast)"""
+        with self._lock:
+            self.enqueued -= count
+
+    def case_started(self, case=None):
+        with self._lock:
+            self.started += 1
+
+    def observe(self, test_case):
+        """Count one finished case and bin its execution time"""
+        execution_time = test_case["execution_time"]
+        index = bisect.bisect_left(self.buckets, execution_time)
+        with self._lock:
+            if test_case["status"] == "PASSED":
+                self.passed += 1
+            else:
+                self.failed += 1
+            self.bucket_counts[index] += 1
+            self.execution_time_sum += execution_time
+
+    def snapshot(self):
+        """Point-in-time view of every metric, JSON-ready"""
+        with self._lock:
+            completed = self.passed + self.failed
+            snapshot = {
+                "timestamp": time.time(),
+                "elapsed_s": time.time() - self.started_at,
+                "tests_completed": completed,
+                "tests_passed": self.passed,
+                "tests_failed": self.failed,
+                # Cases finishing without a start signal count as instantaneous
+                "workers_in_flight": max(0, self.started - completed),
+                "queue_depth": max(0, self.enqueued - max(self.started, completed)),
+                "execution_time_sum": self.execution_time_sum,
+                "execution_time_buckets": dict(zip(
+                    [str(bound) for bound in self.buckets] + ["+Inf"],
+                    _cumulative(self.bucket_counts)
+                ))
+            }
+        snapshot["tests_per_second"] = completed / snapshot["elapsed_s"] if snapshot["elapsed_s"] else 0
+        if self.session_pool is not None:
+            snapshot["session_pool"] = self.session_pool.stats()
+        if self.page_stats is not None:
+            snapshot["page_cache"] = self.page_stats.to_dict()
+        return snapshot
+
+    def render_prometheus(self):
+        """The snapshot in Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        ns = self.namespace
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {ns}_{name} {help_text}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{ns}_{name}{suffix}{labels} {value}")
+
+        metric("tests_completed_total", "counter", "Test cases finished", [
+            ("", '{status="passed"}', snapshot["tests_passed"]),
+            ("", '{status="failed"}', snapshot["tests_failed"])
+        ])
+        metric("tests_per_second", "gauge", "Test cases finished per second since the suite started",
+               [("", "", f"{snapshot['tests_per_second']:.6f}")])
+        metric("workers_in_flight", "gauge", "Test cases currently executing",
+               [("", "", snapshot["workers_in_flight"])])
+        metric("queue_depth", "gauge", "Scheduled test cases not yet started",
+               [("", "", snapshot["queue_depth"])])
+        metric("test_execution_seconds", "histogram", "Test case execution time", [
+            *(("_bucket", f'{{le="{bound}"}}', count)
+              for bound, count in snapshot["execution_time_buckets"].items()),
+            ("_sum", "", f"{snapshot['execution_time_sum']:.6f}"),
+            ("_count", "", snapshot["tests_completed"])
+        ])
+        if "session_pool" in snapshot:
+            pool = snapshot["session_pool"]
+            metric("browser_sessions_launched_total", "counter", "Browser sessions launched",
+                   [("", "", pool["launches"])])
+            metric("browser_session_reuses_total", "counter", "Warm browser sessions handed out again",
+                   [("", "", pool["reuses"])])
+            metric("browser_sessions_idle", "gauge", "Warm browser sessions waiting in the pool",
+                   [("", "", pool["idle"])])
+        if "page_cache" in snapshot:
+            cache = snapshot["page_cache"]
+            metric("page_cache_lookups_total", "counter", "Element lookups by cache outcome", [
+                ("", '{result="hit"}', cache["hits"]),
+                ("", '{result="miss"}', cache["misses"]),
+                ("", '{result="stale"}', cache["stale"])
+            ])
+            metric("page_reuses_total", "counter", "Cases that reused an already loaded page",
+                   [("", "", cache["page_reuses"])])
+        return "\n".join(lines) + "\n"
+
+    def write_snapshot(self, filename="suite_metrics.json"):
+        """Atomically replace ``filename`` with the current snapshot"""
+        temporary = f"{filename}.tmp"
+        with open(temporary, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(temporary, filename)
+
+
+def _cumulative(counts):
+    total, cumulative = 0, []
+    for count in counts:
+        total += count
+        cumulative.append(total)
+    return cumulative
+
+
+class SnapshotWriter:
+    """Writes a metrics snapshot file every ``interval`` seconds on a background thread"""
+
+    def __init__(self, metrics, filename="suite_metrics.json", interval=1.0):
+        self.metrics = metrics
+        self.filename = filename
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-snapshots", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.metrics.write_snapshot(self.filename)
+
+    def stop(self):
+        """Stop the thread and write a final snapshot"""
+        self._stop.set()
+        self._thread.join()
+        self.metrics.write_snapshot(self.filename)
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics (Prometheus text) and /metrics.json (snapshot)"""
+
+    def do_GET(self):
+        if self.path.startswith("/metrics.json"):
+            body = json.dumps(self.server.metrics.snapshot()).encode("utf-8")
+            content_type = "application/json"
+        elif self.path.startswith("/metrics"):
+            body = self.server.metrics.render_prometheus().encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep suite output quiet"""
+
+
+def start_metrics_server(metrics, host="127.0.0.1", port=0):
+    """Serve ``metrics`` on a background thread; returns (server, metrics URL)"""
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    server.metrics = metrics
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/metrics"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show the latest suite metrics snapshot file")
+    parser.add_argument("filename", nargs="?", default="suite_metrics.json")
+    args = parser.parse_args()
+
+    with open(args.filename) as f:
+        print(json.dumps(json.load(f), indent=2))
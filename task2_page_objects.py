@@ -0,0 +1,140 @@
+# Task 2: Page Objects and Locator Cache
+# Per-session element handle cache with stale-element recovery and XPath-to-CSS locator compilation
+
+import re
+import threading
+from functools import lru_cache
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support import expected_conditions as EC
+
+# //tag[@attr='value'][@other="value"] (tag may be *) has an exact CSS equivalent
+_SIMPLE_XPATH = re.compile(r"""^//(\*|[A-Za-z][\w-]*)((?:\[@[\w-]+=(?:'[^']*'|"[^"]*")\])*)$""")
+_XPATH_PREDICATE = re.compile(r"""\[@([\w-]+)=('[^']*'|"[^"]*")\]""")
+
+
+@lru_cache(maxsize=None)
+def _compile(strategy, value):
+    if strategy != "xpath":
+        return strategy, value
+    match = _SIMPLE_XPATH.match(value)
+    if match is None:
+        return strategy, value
+    tag, predicates = match.groups()
+    attributes = _XPATH_PREDICATE.findall(predicates)
+    if tag == "*" and len(attributes) == 1 and attributes[0][0] == "id":
+        return "id", attributes[0][1][1:-1]
+    css = "" if tag == "*" and attributes else tag
+    css += "".join(f"[{name}={quoted}]" for name, quoted in attributes)
+    return "css selector", css
+
+
+def compile_locator(locator):
+    """
+    Turn a scenario locator into the (By, value) tuple to query with
+
+    Simple XPath locators are rewritten to the equivalent ID or CSS lookup,
+    which browsers resolve natively instead of through the XPath engine
+    (``//button[@type='submit']`` becomes ``button[type='submit']``).
+    Anything else is kept as written. Results are memoized, so each
+    distinct locator is compiled once per process.
+    """
+    return _compile(*locator)
+
+
+class PageCacheStats:
+    """Cache counters shared by every session of a suite (thread-safe)"""
+
+    FIELDS = ("hits", "misses", "stale", "page_loads", "page_reuses")
+
+    def __init__(self):
+        self.counts = dict.fromkeys(self.FIELDS, 0)
+        self._lock = threading.Lock()
+
+    def add(self, field, count=1):
+        with self._lock:
+            self.counts[field] += count
+
+    def to_dict(self):
+        with self._lock:
+            counts = dict(self.counts)
+        lookups = counts["hits"] + counts["misses"]
+        counts["hit_rate"] = (counts["hits"] / lookups * 100) if lookups else 0
+        # Every hit skips one find_element round-trip; every reuse skips a page load
+        counts["round_trips_saved"] = counts["hits"] + counts["page_reuses"]
+        return counts
+
+
+class SessionPageCache:
+    """
+    Page object layer for one WebDriver session
+
+    Element handles are cached per compiled locator for as long as the
+    current document lives. A navigation clears the cache; a handle that
+    went stale anyway (the page re-rendered, e.g. after a form post) raises
+    StaleElementReferenceException on use, is dropped and looked up again
+    once, so callers never see stale handles. Pages seen re-rendering are
+    remembered, and their handles are dropped after every later submit
+    instead of being discovered stale again.
+    """
+
+    def __init__(self, driver, stats=None):
+        """Bind to a session; ``stats`` may be shared across sessions"""
+        self.driver = driver
+        self.stats = stats if stats is not None else PageCacheStats()
+        self.url = None
+        self._handles = {}
+        self._rerendering = set()
+
+    def open(self, url):
+        """Load ``url`` in the session, discarding handles from the previous document"""
+        self._handles.clear()
+        self.driver.get(url)
+        self.url = url
+        self.stats.add("page_loads")
+
+    def can_reuse(self, url):
+        """Whether ``url`` is still the loaded document (counts a page reuse when it is)"""
+        if self.url != url or self.driver.current_url != url:
+            return False
+        self.stats.add("page_reuses")
+        return True
+
+    def invalidate(self):
+        """Forget every handle (the document is known to have changed)"""
+        self._handles.clear()
+
+    def note_submit(self):
+        """A form was submitted; drop handles if this page re-renders on submit"""
+        if self.url in self._rerendering:
+            self._handles.clear()
+
+    def find(self, locator, wait, label="locate", record=None):
+        """The element for ``locator``, from the cache or located (and cached) now"""
+        locator = compile_locator(locator)
+        element = self._handles.get(locator)
+        if element is not None:
+            self.stats.add("hits")
+            return element
+
+        self.stats.add("misses")
+        element = wait.until(EC.presence_of_element_located(locator), label=label, record=record)
+        self._handles[locator] = element
+        return element
+
+    def perform(self, locator, action, wait, label="locate", record=None, element=None):
+        """
+        Run ``action(element)`` on the element for ``locator`` (or the
+        ``element`` already found for it)
+
+        Retries once with a fresh lookup if the cached handle turns out stale.
+        """
+        if element is None:
+            element = self.find(locator, wait, label=label, record=record)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            self.stats.add("stale")
+            self._rerendering.add(self.url)
+            self._handles.clear()
+            return action(self.find(locator, wait, label=label, record=record))
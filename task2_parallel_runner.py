@@ -0,0 +1,93 @@
+# Task 2: Parallel Test Execution
+# Spreads login test cases across a pool of independent browser sessions
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+
+class ParallelTestScheduler:
+    """
+    Runs test cases concurrently on a fixed number of workers
+
+    Each worker thread owns a private tester (and therefore a private
+    WebDriver with its own cookies and session state). WebDriver calls are
+    network round-trips to the browser, so threads give real concurrency
+    without the cost of pickling testers across processes. The worker
+    threads (and so their testers) live until ``shutdown()``, so several
+    ``run()`` calls share the same ``workers`` browser sessions.
+    """
+
+    def __init__(self, workers=4, tester_factory=None):
+        """Configure the worker count and how each worker builds its tester"""
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if tester_factory is None:
+            raise ValueError("tester_factory is required")
+
+        self.workers = workers
+        self.tester_factory = tester_factory
+        self._local = threading.local()
+        self._testers = []
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_tester(self):
+        """Return this worker thread's tester, creating it on first use"""
+        tester = getattr(self._local, "tester", None)
+        if tester is None:
+            tester = self.tester_factory()
+            self._local.tester = tester
+            with self._lock:
+                self._testers.append(tester)
+        return tester
+
+    def _run_case(self, method_name, args):
+        """Execute a single (method name, arguments) case on this worker"""
+        return getattr(self._get_tester(), method_name)(*args)
+
+    def run(self, test_cases, stop_when=None, shutdown=True):
+        """Execute all cases and return their results in submission order
+
+        When ``stop_when(result)`` is true for a finished case, cases that
+        have not started yet are cancelled and their results left as None.
+        With ``shutdown=False`` the worker threads and their testers (and
+        browser sessions) are kept for the next call; call ``shutdown()``
+        when done.
+        """
+        results = [None] * len(test_cases)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="test-worker")
+
+        try:
+            futures = {
+                self._executor.submit(self._run_case, method_name, args): index
+                for index, (method_name, args) in enumerate(test_cases)
+            }
+            try:
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    results[futures[future]] = future.result()
+                    if stop_when is not None and stop_when(results[futures[future]]):
+                        for pending in futures:
+                            pending.cancel()
+            finally:
+                # Never return (or shut down) with cases still running
+                for pending in futures:
+                    pending.cancel()
+                wait(futures)
+        finally:
+            if shutdown:
+                self.shutdown()
+
+        return results
+
+    def shutdown(self):
+        """Stop the worker threads and release every worker's browser session"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            testers, self._testers = self._testers, []
+        for tester in testers:
+            tester.cleanup()
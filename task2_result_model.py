@@ -0,0 +1,135 @@
+# Task 2: Compact Test Result Model
+# __slots__ records with interned statuses and per-run shared environment metadata
+
+import sys
+from collections.abc import Mapping
+from datetime import datetime
+
+PASSED = sys.intern("PASSED")
+FAILED = sys.intern("FAILED")
+_STATUSES = {PASSED: PASSED, FAILED: FAILED}
+
+# Error messages repeat across thousands of cases ("Timeout waiting for
+# page load", ...); keep one copy of each, up to a bound
+_ERROR_TABLE = {}
+_ERROR_TABLE_LIMIT = 10000
+
+
+def intern_status(status):
+    return _STATUSES.get(status) or sys.intern(status)
+
+
+def intern_error(error):
+    if error is None:
+        return None
+    canonical = _ERROR_TABLE.get(error)
+    if canonical is None:
+        canonical = error
+        if len(_ERROR_TABLE) < _ERROR_TABLE_LIMIT:
+            _ERROR_TABLE[error] = error
+    return canonical
+
+
+class RunEnvironment:
+    """Environment metadata shared by every result of one run (stored once)"""
+
+    __slots__ = ("browser", "platform", "viewport")
+
+    def __init__(self, browser, platform, viewport):
+        self.browser = browser
+        self.platform = platform
+        self.viewport = viewport
+
+
+class TestCaseResult(Mapping):
+    """
+    One test case result
+
+    Behaves like the result dicts used so far (``test["status"]``,
+    ``test.get("wait_time")``, ``test["status"] = ...``), but stores its
+    fields in slots, interns status and error strings, references a shared
+    RunEnvironment and keeps the timestamp as epoch seconds. ``to_dict()``
+    produces the original JSON layout.
+    """
+
+    __slots__ = ("name", "_status", "_error", "execution_time", "wait_time",
+                 "waits", "steps", "timestamp", "environment")
+
+    # Always part of the layout; the remaining fields only when set
+    _REQUIRED = ("name", "status", "error", "execution_time")
+    _OPTIONAL = ("wait_time", "waits", "steps")
+
+    def __init__(self, name, status=FAILED, error=None, execution_time=0, wait_time=None,
+                 waits=None, steps=None, timestamp=None, environment=None):
+        self.name = name
+        self.status = status
+        self.error = error
+        self.execution_time = execution_time
+        self.wait_time = wait_time
+        self.waits = waits
+        self.steps = steps
+        self.timestamp = timestamp
+        self.environment = environment
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = intern_status(value)
+
+    @property
+    def error(self):
+        return self._error
+
+    @error.setter
+    def error(self, value):
+        self._error = intern_error(value)
+
+    def _keys(self):
+        keys = list(self._REQUIRED)
+        keys.extend(key for key in self._OPTIONAL if getattr(self, key) is not None)
+        if self.environment is not None:
+            keys.append("details")
+        return keys
+
+    def __getitem__(self, key):
+        if key == "details" and self.environment is not None:
+            return self.details()
+        if key in self._REQUIRED or (key in self._OPTIONAL and getattr(self, key) is not None):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self._REQUIRED and key not in self._OPTIONAL:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def details(self):
+        """Expand the shared environment into the legacy ``details`` dict"""
+        return {
+            "browser": self.environment.browser,
+            "platform": self.environment.platform,
+            "viewport": self.environment.viewport,
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat() if self.timestamp else None
+        }
+
+    def to_dict(self):
+        return {key: self[key] for key in self._keys()}
+
+    def __repr__(self):
+        return f"TestCaseResult(name={self.name!r}, status={self.status!r})"
+
+
+def to_jsonable(obj):
+    """``default=`` hook for json.dump so result records serialize transparently"""
+    if isinstance(obj, TestCaseResult):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
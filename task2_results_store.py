@@ -0,0 +1,249 @@
+# Task 2: Historical Results Store
+# Embedded SQLite history of every suite run, indexed for trend queries
+
+import argparse
+import json
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    suite TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    total_tests INTEGER NOT NULL,
+    success_rate REAL NOT NULL,
+    execution_time REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    suite TEXT NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    execution_time REAL NOT NULL,
+    error TEXT,
+    recorded_at REAL NOT NULL
+);
+-- Per-test rollup maintained on ingest so flake/failure queries are O(1);
+-- suites may reuse test names, so every per-test table is keyed by both
+CREATE TABLE IF NOT EXISTS test_stats (
+    suite TEXT NOT NULL,
+    name TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    transitions INTEGER NOT NULL,
+    total_time REAL NOT NULL DEFAULT 0,
+    last_status TEXT NOT NULL,
+    last_run_at REAL NOT NULL,
+    last_failure_at REAL,
+    PRIMARY KEY (suite, name)
+);
+-- Last recorded definition (URL, locators, inputs, expectation) of each test,
+-- so later runs can tell which tests a page or locator change touches
+CREATE TABLE IF NOT EXISTS test_fingerprints (
+    suite TEXT NOT NULL,
+    name TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (suite, name)
+);
+CREATE INDEX IF NOT EXISTS idx_results_suite_name_time ON test_results(suite, name, execution_time);
+CREATE INDEX IF NOT EXISTS idx_results_suite_name_status_recorded ON test_results(suite, name, status, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_results_recorded ON test_results(recorded_at);
+"""
+
+PERCENTILES = (50, 95, 99)
+
+
+class ResultsStore:
+    """
+    Local history of test runs
+
+    Raw results are kept for latency percentiles (one ordered pass over the
+    (suite, name, execution_time) index per test) while run counts,
+    failures and status flips are rolled up per test on ingest. A "flake"
+    is a status change between consecutive runs of the same test. Tests
+    are identified by suite and name, so suites sharing test names keep
+    separate histories.
+    """
+
+    def __init__(self, filename="test_history.db"):
+        """Open (or create) the store"""
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def ingest_run(self, results, suite="login", started_at=None, fingerprints=None, test_cases=None):
+        """Record one suite run (the ``results`` dict of a tester); returns the run id
+
+        ``fingerprints`` maps test names to the definition hash they ran with.
+        ``test_cases`` overrides ``results["test_cases"]``, for testers that
+        stream their records instead of keeping them all.
+        """
+        recorded_at = time.time() if started_at is None else started_at
+        test_cases = results["test_cases"] if test_cases is None else test_cases
+
+        with self.conn:
+            run_id = self.conn.execute(
+                "INSERT INTO runs (suite, started_at, total_tests, success_rate, execution_time) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (suite, recorded_at, results["total_tests"], results["success_rate"], results["execution_time"])
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO test_results (run_id, suite, name, status, execution_time, error, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, suite, test["name"], test["status"], test["execution_time"], test["error"],
+                     recorded_at)
+                    for test in test_cases
+                ]
+            )
+            self._update_stats(suite, test_cases, recorded_at)
+            if fingerprints:
+                self.conn.executemany(
+                    "INSERT INTO test_fingerprints (suite, name, fingerprint, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(suite, name) DO UPDATE SET fingerprint = excluded.fingerprint, "
+                    "updated_at = excluded.updated_at",
+                    [(suite, name, fingerprint, recorded_at) for name, fingerprint in fingerprints.items()]
+                )
+        return run_id
+
+    def _update_stats(self, suite, test_cases, recorded_at):
+        """Roll the run up per test first, then touch each stats row once"""
+        rollup = {}
+        for test in test_cases:
+            failed = test["status"] != "PASSED"
+            entry = rollup.get(test["name"])
+            if entry is None:
+                rollup[test["name"]] = [1, int(failed), 0, test["status"], test["status"], test["execution_time"]]
+            else:
+                entry[0] += 1
+                entry[1] += failed
+                entry[2] += entry[4] != test["status"]
+                entry[4] = test["status"]
+                entry[5] += test["execution_time"]
+
+        for name, (runs, failures, transitions, first_status, last_status, total_time) in rollup.items():
+            row = self.conn.execute(
+                "SELECT last_status FROM test_stats WHERE suite = ? AND name = ?", (suite, name)
+            ).fetchone()
+            if row is not None:
+                transitions += row["last_status"] != first_status
+            self.conn.execute(
+                "INSERT INTO test_stats (suite, name, runs, failures, transitions, total_time, last_status, "
+                "last_run_at, last_failure_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(suite, name) DO UPDATE SET runs = runs + excluded.runs, "
+                "failures = failures + excluded.failures, transitions = excluded.transitions + transitions, "
+                "total_time = total_time + excluded.total_time, "
+                "last_status = excluded.last_status, last_run_at = excluded.last_run_at, "
+                "last_failure_at = COALESCE(excluded.last_failure_at, last_failure_at)",
+                (suite, name, runs, failures, transitions, total_time, last_status, recorded_at,
+                 recorded_at if failures else None)
+            )
+
+    def test_priors(self, suite="login"):
+        """Rollup and mean execution time of every recorded test of a suite, from the rollup table alone"""
+        rows = self.conn.execute(
+            "SELECT name, runs, failures, transitions, last_status, total_time / runs AS mean_time "
+            "FROM test_stats WHERE suite = ?",
+            (suite,)
+        )
+        return {row["name"]: dict(row) for row in rows}
+
+    def fingerprints(self, suite="login"):
+        """Definition hash each test of a suite last ran with"""
+        rows = self.conn.execute("SELECT name, fingerprint FROM test_fingerprints WHERE suite = ?", (suite,))
+        return {row["name"]: row["fingerprint"] for row in rows}
+
+    def execution_time_percentiles(self, name, suite="login", percentiles=PERCENTILES, count=None):
+        """Nearest-rank execution time percentiles for one test, in one ordered pass"""
+        if count is None:
+            count = self.conn.execute(
+                "SELECT COUNT(*) FROM test_results WHERE suite = ? AND name = ?", (suite, name)
+            ).fetchone()[0]
+        if not count:
+            return {}
+
+        ranks = {}
+        for p in percentiles:
+            ranks.setdefault(max(0, min(count - 1, -(-p * count // 100) - 1)), []).append(p)
+        last = max(ranks)
+        values = {}
+        rows = self.conn.execute(
+            "SELECT execution_time FROM test_results WHERE suite = ? AND name = ? ORDER BY execution_time",
+            (suite, name)
+        )
+        for rank, (execution_time,) in enumerate(rows):
+            for p in ranks.get(rank, ()):
+                values[f"p{p}"] = execution_time
+            if rank == last:
+                break
+        return {f"p{p}": values[f"p{p}"] for p in percentiles}
+
+    def test_history(self, name, suite="login", now=None):
+        """Runs, failure and flake rates, latency percentiles and time since last failure"""
+        row = self.conn.execute(
+            "SELECT * FROM test_stats WHERE suite = ? AND name = ?", (suite, name)
+        ).fetchone()
+        if row is None:
+            return None
+
+        now = time.time() if now is None else now
+        return {
+            "suite": suite,
+            "name": name,
+            "runs": row["runs"],
+            "failure_rate": row["failures"] / row["runs"] * 100,
+            "flake_rate": (row["transitions"] / (row["runs"] - 1) * 100) if row["runs"] > 1 else 0,
+            "seconds_since_last_failure": (now - row["last_failure_at"]) if row["last_failure_at"] is not None else None,
+            # Every result is counted in runs, so the rollup saves a COUNT(*)
+            **self.execution_time_percentiles(name, suite, count=row["runs"])
+        }
+
+    def history_report(self, names=None, suite=None):
+        """History for the given tests of ``suite`` (default: every test of every suite)"""
+        if names is None:
+            query = "SELECT suite, name FROM test_stats"
+            params = ()
+            if suite is not None:
+                query += " WHERE suite = ?"
+                params = (suite,)
+            keys = [(row["suite"], row["name"]) for row in self.conn.execute(query + " ORDER BY suite, name", params)]
+        else:
+            keys = [(suite or "login", name) for name in names]
+        now = time.time()
+        return [history for history in (self.test_history(name, suite, now) for suite, name in keys) if history]
+
+    def assess_risk(self, names, suite="login"):
+        """Risk assessment for a suite, grounded in the history of its tests"""
+        history = self.history_report(names, suite)
+        if not history:
+            return "Unknown risk: no historical runs recorded yet"
+
+        failing = [h for h in history if h["failure_rate"] >= 20]
+        flaky = [h for h in history if h["flake_rate"] >= 5]
+        if failing:
+            worst = max(failing, key=lambda h: h["failure_rate"])
+            return (f"High risk: {len(failing)} tests fail in 20%+ of historical runs "
+                    f"(worst: {worst['name']}, {worst['failure_rate']:.0f}% of {worst['runs']} runs)")
+        if flaky:
+            worst = max(flaky, key=lambda h: h["flake_rate"])
+            return (f"Medium risk: {len(flaky)} flaky tests "
+                    f"(flakiest: {worst['name']}, flips status in {worst['flake_rate']:.0f}% of runs)")
+        return f"Low risk: stable history across {max(h['runs'] for h in history)} runs"
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report test history from a results store")
+    parser.add_argument("filename", nargs="?", default="test_history.db")
+    args = parser.parse_args()
+
+    store = ResultsStore(args.filename)
+    print(json.dumps(store.history_report(), indent=2))
+    store.close()
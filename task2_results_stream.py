@@ -0,0 +1,131 @@
+# Task 2: Streaming Results Writer
+# Appends one JSON Lines record per finished test and aggregates result files lazily
+
+import argparse
+import json
+import os
+import threading
+import time
+
+
+class JsonlResultsSink:
+    """
+    Incremental results writer
+
+    Every test case is appended as one compact JSON line the moment it
+    finishes, so a crash loses at most the unsynced tail. Lines are flushed
+    immediately and fsync'd in batches (every ``fsync_every`` records or
+    ``fsync_interval`` seconds). ``close()`` appends a summary record built
+    from running totals, never from a rescan of the file.
+    """
+
+    def __init__(self, filename="test_results.jsonl", fsync_every=100, fsync_interval=1.0, run_info=None):
+        """Open (append mode) and write a run header record"""
+        self.filename = filename
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._file = open(filename, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.totals = {"total_tests": 0, "passed": 0, "failed": 0, "execution_time": 0.0}
+        self._write_record({"type": "run_start", "timestamp": time.time(), **(run_info or {})})
+
+    def write(self, test_case):
+        """Append one finished test case"""
+        with self._lock:
+            self.totals["total_tests"] += 1
+            self.totals["passed" if test_case["status"] == "PASSED" else "failed"] += 1
+            self.totals["execution_time"] += test_case["execution_time"]
+            self._write_record({"type": "test_case", "seq": self.totals["total_tests"], **test_case})
+
+    def close(self, summary=None):
+        """Append the aggregate summary record, sync and close the file"""
+        with self._lock:
+            if self._file.closed:
+                return
+            total = self.totals["total_tests"]
+            self._write_record({
+                "type": "summary",
+                **self.totals,
+                "success_rate": (self.totals["passed"] / total * 100) if total else 0,
+                "timestamp": time.time(),
+                **(summary or {})
+            })
+            self._sync()
+            self._file.close()
+
+    def _write_record(self, record):
+        """Write one line (caller holds the lock)"""
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str))
+        self._file.write("\n")
+        self._file.flush()
+        self._unsynced += 1
+        if (self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval):
+            self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def iter_results(filename):
+    """
+    Yield test case records one at a time
+
+    A truncated final line (from a crash mid-write) is skipped rather than
+    treated as an error.
+    """
+    with open(filename, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("type") == "test_case":
+                yield record
+
+
+def aggregate_results_file(filename):
+    """Aggregate a results file of any size in a single streaming pass"""
+    summary = {
+        "total_tests": 0,
+        "passed": 0,
+        "failed": 0,
+        "execution_time": 0.0,
+        "max_execution_time": 0.0,
+        "by_test": {}
+    }
+
+    for record in iter_results(filename):
+        passed = record["status"] == "PASSED"
+        summary["total_tests"] += 1
+        summary["passed" if passed else "failed"] += 1
+        summary["execution_time"] += record["execution_time"]
+        summary["max_execution_time"] = max(summary["max_execution_time"], record["execution_time"])
+
+        per_test = summary["by_test"].setdefault(record["name"], {"runs": 0, "failed": 0})
+        per_test["runs"] += 1
+        if not passed:
+            per_test["failed"] += 1
+
+    total = summary["total_tests"]
+    summary["success_rate"] = (summary["passed"] / total * 100) if total else 0
+    summary["average_execution_time"] = (summary["execution_time"] / total) if total else 0
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregate a JSON Lines test results file")
+    parser.add_argument("filename")
+    args = parser.parse_args()
+
+    print(json.dumps(aggregate_results_file(args.filename), indent=2))
@@ -0,0 +1,119 @@
+# Task 2: Data-Driven Login Scenarios
+# Expands declarative scenario files into concrete login test cases
+
+import itertools
+import json
+import os
+from urllib.parse import urljoin
+
+try:
+    import yaml
+except ImportError:  # YAML scenario files are optional
+    yaml = None
+
+DEFAULT_SCENARIO_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "login_scenarios.json")
+
+DEFAULT_LOCATORS = {
+    "username": ["name", "username"],
+    "password": ["name", "password"],
+    "submit": ["xpath", "//button[@type='submit']"]
+}
+
+EXPECTATION_TYPES = ("url_changes", "element_visible")
+
+# Counter-evidence that ends a "url_changes" wait early instead of timing out
+DEFAULT_FAILURE_LOCATORS = [
+    ["class name", "error-message"],
+    ["class name", "validation-error"]
+]
+
+# "browser" drives Selenium; "http" posts the form directly (no JavaScript)
+EXECUTION_MODES = ("browser", "http")
+
+
+def load_scenarios(path=DEFAULT_SCENARIO_FILE):
+    """Read a scenario file (JSON, or YAML when PyYAML is installed)"""
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ImportError("PyYAML is required to load YAML scenario files")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    defaults = spec.get("defaults", {})
+    scenarios = []
+    for raw in spec.get("scenarios", []):
+        scenario = {**defaults, **raw}
+        scenario["locators"] = {**DEFAULT_LOCATORS, **defaults.get("locators", {}), **raw.get("locators", {})}
+        scenario["matrix"] = {
+            field: _resolve_values(values, base_dir)
+            for field, values in scenario.get("matrix", {}).items()
+        }
+        expect = scenario.get("expect", {"type": "url_changes"})
+        if expect.get("type") not in EXPECTATION_TYPES:
+            raise ValueError(f"Unknown expectation type in scenario {scenario.get('name')!r}: {expect.get('type')!r}")
+        scenario["expect"] = expect
+        scenario.setdefault("mode", "browser")
+        if scenario["mode"] not in EXECUTION_MODES:
+            raise ValueError(f"Unknown mode in scenario {scenario.get('name')!r}: {scenario['mode']!r}")
+        scenarios.append(scenario)
+    return scenarios
+
+
+def _resolve_values(values, base_dir):
+    """Matrix values are an inline list or a {"file": ...} corpus, one value per line"""
+    if isinstance(values, dict) and "file" in values:
+        corpus = os.path.join(base_dir, values["file"])
+        with open(corpus, encoding="utf-8") as f:
+            return [line.rstrip("\n") for line in f if line.strip()]
+    if not isinstance(values, list):
+        return [values]
+    return values
+
+
+def expand_scenarios(scenarios, base_url):
+    """
+    Expand scenarios into concrete cases
+
+    Every field in a scenario's ``matrix`` contributes one axis; the cases
+    are the cartesian product of those axes merged over the fixed ``inputs``.
+    Scenario URLs are resolved relative to ``base_url``.
+    """
+    for scenario in scenarios:
+        url = urljoin(base_url, scenario.get("url", ""))
+        fields = list(scenario["matrix"])
+        combos = itertools.product(*(scenario["matrix"][field] for field in fields)) if fields else [()]
+        for index, combo in enumerate(combos):
+            inputs = {**scenario.get("inputs", {}), **dict(zip(fields, combo))}
+            yield {
+                "name": scenario["name"] if not fields else f"{scenario['name']} [{index}]",
+                "url": url,
+                "locators": scenario["locators"],
+                "inputs": inputs,
+                "expect": scenario["expect"],
+                "mode": scenario["mode"],
+                "action": scenario.get("action", ""),
+                "share_page_load": scenario.get("share_page_load", False)
+            }
+
+
+def batch_cases(cases):
+    """
+    Group consecutive cases that can run against a single page load
+
+    A batch holds cases with the same URL and locators whose scenario opts
+    in through ``share_page_load``; any other case forms a batch of one.
+    """
+    batches = []
+    for case in cases:
+        if batches and case["share_page_load"]:
+            previous = batches[-1][-1]
+            if (previous["share_page_load"]
+                    and previous["url"] == case["url"]
+                    and previous["locators"] == case["locators"]):
+                batches[-1].append(case)
+                continue
+        batches.append([case])
+    return batches
@@ -0,0 +1,141 @@
+# Task 2: Warm Browser Session Pool
+# Keeps headless browsers alive across suite runs instead of a cold start per tester
+
+import threading
+
+
+class BrowserSessionPool:
+    """
+    Broker for reusable WebDriver sessions
+
+    Released sessions are reset (cookies, storage, about:blank) and kept
+    warm for the next tester. Sessions are recycled after ``max_uses``
+    acquisitions or as soon as they fail a health check, and the pool keeps
+    launch-versus-reuse counters so the amortized startup cost is visible.
+    """
+
+    def __init__(self, driver_factory, max_idle=4, max_uses=50):
+        """Configure how sessions are launched and how long they live"""
+        if max_idle < 0:
+            raise ValueError("max_idle must not be negative")
+        if max_uses < 1:
+            raise ValueError("max_uses must be at least 1")
+
+        self.driver_factory = driver_factory
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self.counters = {
+            "launches": 0,
+            "reuses": 0,
+            "recycled": 0,
+            "unhealthy": 0
+        }
+
+    def acquire(self):
+        """Return a warm session if one is idle, otherwise launch a new one"""
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("session pool is closed")
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                break
+            # Health checks and quits are WebDriver round-trips, so they run
+            # outside the lock and never serialize other workers
+            healthy = self.is_healthy(driver)
+            with self._lock:
+                if healthy:
+                    self._uses[id(driver)] += 1
+                    self.counters["reuses"] += 1
+                    return driver
+                self.counters["unhealthy"] += 1
+                self._forget(driver)
+            self._quit(driver)
+
+        driver = self.driver_factory()
+        with self._lock:
+            self._uses[id(driver)] = 1
+            self.counters["launches"] += 1
+        return driver
+
+    def release(self, driver, healthy=True):
+        """Hand a session back; it is reset and kept warm when possible"""
+        if driver is None:
+            return
+
+        keep = healthy and self.reset_session(driver)
+        with self._lock:
+            discard = True
+            if not keep:
+                self.counters["unhealthy"] += 1
+            elif self._uses.get(id(driver), 0) >= self.max_uses:
+                self.counters["recycled"] += 1
+            elif not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(driver)
+                discard = False
+            if discard:
+                self._forget(driver)
+        if discard:
+            self._quit(driver)
+
+    def reset_session(self, driver):
+        """Clear cookies and web storage, then park the session on about:blank"""
+        try:
+            driver.delete_all_cookies()
+            try:
+                # Storage is only reachable from a real origin, so clear it
+                # before leaving the current page
+                driver.execute_script(
+                    "window.localStorage.clear(); window.sessionStorage.clear();"
+                )
+            except Exception:
+                pass
+            driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def is_healthy(driver):
+        """A session is healthy if the browser still answers a cheap command"""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def stats(self):
+        """Report launch/reuse counters and the current pool occupancy"""
+        with self._lock:
+            acquisitions = self.counters["launches"] + self.counters["reuses"]
+            return {
+                **self.counters,
+                "idle": len(self._idle),
+                "reuse_rate": (self.counters["reuses"] / acquisitions * 100) if acquisitions else 0
+            }
+
+    def close(self):
+        """Quit every idle session; sessions released later are quit too"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for driver in idle:
+                self._forget(driver)
+        for driver in idle:
+            self._quit(driver)
+
+    def _forget(self, driver):
+        """Drop a session's use count (caller holds the lock)"""
+        self._uses.pop(id(driver), None)
+
+    @staticmethod
+    def _quit(driver):
+        """Quit a session, ignoring browsers that already went away"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
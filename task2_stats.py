@@ -0,0 +1,184 @@
+# Task 2: Incremental Result Statistics
+# Constant-time aggregates updated as each test finishes
+
+import math
+import threading
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class RunningStats:
+    """Count, mean, variance (Welford), min and max in O(1) per update"""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max", "total")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.total = 0.0
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate with five markers (Jain & Chlamtac's P² algorithm)
+
+    Uses constant memory regardless of how many values are observed; the
+    first five observations are answered exactly.
+    """
+
+    __slots__ = ("p", "_q", "_n", "_np", "_dn")
+
+    def __init__(self, p):
+        self.p = p
+        self._q = []
+        self._n = [0, 1, 2, 3, 4]
+        self._np = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self._dn = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x):
+        q, n = self._q, self._n
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(1, 5) if x < q[i]) - 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._np[i] += self._dn[i]
+
+        for i in (1, 2, 3):
+            d = self._np[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = self._parabolic(i, d)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def _parabolic(self, i, d):
+        q, n = self._q, self._n
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self):
+        if not self._q:
+            return 0.0
+        if len(self._q) < 5 or self._n[4] == 4:
+            index = max(0, math.ceil(self.p * len(self._q)) - 1)
+            return self._q[index]
+        return self._q[2]
+
+
+class ResultsAggregate:
+    """
+    Live summary of a results set
+
+    Updated once per finished test (thread-safe, so parallel workers can
+    share it); every read is O(1) in the number of tests recorded.
+    """
+
+    def __init__(self, quantiles=QUANTILES):
+        self.passed = 0
+        self.failed = 0
+        self.execution_time = RunningStats()
+        self.wait_time = RunningStats()
+        self.quantiles = {q: P2Quantile(q) for q in quantiles}
+        self.steps = {}
+        self.names = set()
+        self._lock = threading.Lock()
+
+    def add(self, test_case):
+        """Fold one finished test case into the aggregate"""
+        with self._lock:
+            if test_case["status"] == "PASSED":
+                self.passed += 1
+            else:
+                self.failed += 1
+            self.names.add(test_case["name"])
+            self.execution_time.add(test_case["execution_time"])
+            self.wait_time.add(test_case.get("wait_time", 0))
+            for estimator in self.quantiles.values():
+                estimator.add(test_case["execution_time"])
+            for step, duration in test_case.get("steps", {}).items():
+                stats = self.steps.get(step)
+                if stats is None:
+                    stats = self.steps[step] = RunningStats()
+                stats.add(duration)
+
+    @property
+    def total(self):
+        return self.passed + self.failed
+
+    @property
+    def success_rate(self):
+        return (self.passed / self.total * 100) if self.total else 0
+
+    def quantile(self, q):
+        return self.quantiles[q].value
+
+    def slowest_steps(self, top=3):
+        """Rank steps by mean duration across every recorded test"""
+        grand_total = sum(stats.total for stats in self.steps.values())
+        ranking = [
+            {
+                "step": step,
+                "mean": stats.mean,
+                "max": stats.max,
+                "share": (stats.total / grand_total * 100) if grand_total else 0
+            }
+            for step, stats in self.steps.items()
+        ]
+        ranking.sort(key=lambda entry: entry["mean"], reverse=True)
+        return ranking[:top]
+
+    def to_dict(self):
+        """Compact, JSON-ready snapshot"""
+        return {
+            "total_tests": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "success_rate": self.success_rate,
+            "execution_time": {
+                "mean": self.execution_time.mean,
+                "stdev": self.execution_time.stdev,
+                "min": self.execution_time.min if self.execution_time.count else 0,
+                "max": self.execution_time.max if self.execution_time.count else 0,
+                **{f"p{round(q * 100)}": estimator.value for q, estimator in self.quantiles.items()}
+            },
+            "wait_time_mean": self.wait_time.mean
+        }
@@ -0,0 +1,94 @@
+# Task 2: Stand-in Login Server
+# A local login page for exercising the Selenium suite and the HTTP fast path
+
+import argparse
+import html
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+VALID_CREDENTIALS = {"testuser": "testpass123"}
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Login</title></head>
+<body>
+  <form method="post" action="/login">
+    <input type="text" name="username" value="{username}">
+    <input type="password" name="password">
+    <button type="submit">Log in</button>
+  </form>
+  {message}
+</body>
+</html>
+"""
+
+DASHBOARD_PAGE = """<!DOCTYPE html>
+<html><head><title>Dashboard</title></head><body><h1>Welcome</h1></body></html>
+"""
+
+
+class StubLoginHandler(BaseHTTPRequestHandler):
+    """Serves /login (GET form, POST credentials) and /dashboard"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/dashboard"):
+            self._send(200, DASHBOARD_PAGE)
+        else:
+            self._send(200, LOGIN_PAGE.format(username="", message=""))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+        username = form.get("username", [""])[0]
+        password = form.get("password", [""])[0]
+
+        if not username or not password:
+            message = '<div class="validation-error">Username and password are required</div>'
+        elif VALID_CREDENTIALS.get(username) == password:
+            self.send_response(303)
+            self.send_header("Location", "/dashboard")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        else:
+            message = '<div class="error-message">Invalid username or password</div>'
+
+        # Echo the username back escaped, as a well-behaved login page would
+        self._send(200, LOGIN_PAGE.format(username=html.escape(username), message=message))
+
+    def _send(self, status, page):
+        body = page.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep test output quiet"""
+
+
+def start_stub_server(host="127.0.0.1", port=0):
+    """Start the server on a background thread; returns (server, login URL)"""
+    server = ThreadingHTTPServer((host, port), StubLoginHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/login"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stand-in login server for Task 2")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), StubLoginHandler)
+    print(f"Stub login page at http://{args.host}:{args.port}/login")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,139 @@
+# Task 2: Smart Test Ordering and Selection
+# Uses run history to surface likely failures first, with fail-fast and impacted-only modes
+
+import hashlib
+import json
+
+from task2_result_model import PASSED
+from task2_scenarios import batch_cases
+
+# Failure probability assumed for tests with no history or a changed definition
+UNKNOWN_FAILURE_PROBABILITY = 0.5
+
+# Status flips between consecutive runs above this rate mark a test as flaky
+# (same 5% bar the history store's risk assessment uses)
+FLAKY_THRESHOLD = 0.05
+
+# Duration assumed when no test has any history yet
+DEFAULT_DURATION = 1.0
+
+
+def case_fingerprint(case):
+    """Hash of what a case exercises: page, locators, inputs, expectation and mode"""
+    definition = {field: case.get(field) for field in ("url", "locators", "inputs", "expect", "mode")}
+    return hashlib.sha1(json.dumps(definition, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def expected_time_to_first_failure(groups):
+    """
+    Expected seconds until the first failing group finishes
+
+    ``groups`` is a sequence of (failure probability, duration) pairs in run
+    order, assumed independent; a run without failures counts in full.
+    """
+    expected, all_passed = 0.0, 1.0
+    for probability, duration in groups:
+        expected += duration * all_passed
+        all_passed *= 1 - probability
+    return expected
+
+
+class TestPrioritizer:
+    """
+    Orders and filters login cases from their history
+
+    Each case gets a failure probability and an expected duration:
+
+    - With history, the probability is the smoothed failure rate
+      ``(failures + 1) / (runs + 2)``; a test that failed on its last run
+      and rarely flips is expected to fail again (``1 - flip rate``).
+    - A case is *impacted* when it is new, its definition changed since it
+      last ran (URL, locators, inputs or expectation), its page is in
+      ``changed_pages`` or one of its locators is in ``changed_locators``
+      (field names or locator values). Impacted cases are treated as
+      unknown, at ``UNKNOWN_FAILURE_PROBABILITY`` or more.
+    - Durations are the mean recorded execution time.
+
+    Cases that share a page load stay together; groups run in decreasing
+    order of failure probability per second (Smith's rule), which minimizes
+    the expected time to the first failure.
+    """
+
+    def __init__(self, results_store=None, changed_pages=(), changed_locators=(),
+                 flaky_threshold=FLAKY_THRESHOLD, suite="login"):
+        """Load the suite's history once; without a store every case counts as new"""
+        self.changed_pages = set(changed_pages)
+        self.changed_locators = set(changed_locators)
+        self.flaky_threshold = flaky_threshold
+        self.priors = results_store.test_priors(suite) if results_store is not None else {}
+        self.known_fingerprints = results_store.fingerprints(suite) if results_store is not None else {}
+        durations = [prior["mean_time"] for prior in self.priors.values()]
+        self.default_duration = sum(durations) / len(durations) if durations else DEFAULT_DURATION
+
+    def is_impacted(self, case):
+        if case["url"] in self.changed_pages:
+            return True
+        if any(field in self.changed_locators or locator[1] in self.changed_locators
+               for field, locator in case["locators"].items()):
+            return True
+        return self.known_fingerprints.get(case["name"]) != case_fingerprint(case)
+
+    def estimate(self, case):
+        """Failure probability, duration, flakiness and impact of one case"""
+        prior = self.priors.get(case["name"])
+        impacted = self.is_impacted(case)
+        if prior is None:
+            return {"failure_probability": UNKNOWN_FAILURE_PROBABILITY, "duration": self.default_duration,
+                    "flaky": False, "impacted": True}
+
+        flip_rate = prior["transitions"] / (prior["runs"] - 1) if prior["runs"] > 1 else 0.0
+        probability = (prior["failures"] + 1) / (prior["runs"] + 2)
+        if prior["last_status"] != PASSED:
+            probability = max(probability, 1 - flip_rate)
+        if impacted:
+            probability = max(probability, UNKNOWN_FAILURE_PROBABILITY)
+        return {
+            "failure_probability": probability,
+            "duration": prior["mean_time"],
+            "flaky": flip_rate >= self.flaky_threshold,
+            "impacted": impacted
+        }
+
+    def plan(self, cases, impacted_only=False):
+        """
+        Reorder (and optionally filter) ``cases``
+
+        Returns the cases to run, the skipped ones, per-case estimates and
+        the expected time to first failure for the original and the new
+        order, plus the run time saved by skipping unimpacted cases.
+        """
+        estimates = {case["name"]: self.estimate(case) for case in cases}
+
+        def group_cost(group):
+            passed = 1.0
+            for case in group:
+                passed *= 1 - estimates[case["name"]]["failure_probability"]
+            return 1 - passed, sum(estimates[case["name"]]["duration"] for case in group)
+
+        groups = batch_cases(cases)
+        baseline = expected_time_to_first_failure([group_cost(group) for group in groups])
+
+        skipped = []
+        if impacted_only:
+            selected = [case for case in cases if estimates[case["name"]]["impacted"]]
+            skipped = [case for case in cases if not estimates[case["name"]]["impacted"]]
+            groups = batch_cases(selected)
+
+        costs = [group_cost(group) for group in groups]
+        ranked = sorted(range(len(groups)),
+                        key=lambda i: -costs[i][0] / costs[i][1] if costs[i][1] else -costs[i][0])
+        ordered = expected_time_to_first_failure([costs[i] for i in ranked])
+        return {
+            "cases": [case for i in ranked for case in groups[i]],
+            "skipped": skipped,
+            "estimates": estimates,
+            "baseline_time_to_first_failure": baseline,
+            "expected_time_to_first_failure": ordered,
+            "skipped_time": sum(estimates[case["name"]]["duration"] for case in skipped),
+            "expected_time_saved": baseline - ordered
+        }
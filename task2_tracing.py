@@ -0,0 +1,110 @@
+# Task 2: Step Timing and Tracing
+# Hierarchical spans on a monotonic clock, exportable to JSON and Chrome traces
+
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Steps every browser login case is broken into
+STEP_NAMES = ("navigate", "locate", "type", "submit", "await outcome")
+
+# Finished spans kept in memory; older ones are dropped (about 5 per case)
+DEFAULT_MAX_SPANS = 100_000
+
+
+class Tracer:
+    """
+    Records nested timing spans
+
+    Spans nest per thread, so one tracer can be shared by parallel workers.
+    Timestamps come from ``time.perf_counter_ns`` and are stored relative to
+    the tracer's creation. Only the latest ``max_spans`` finished spans are
+    kept (``None`` keeps all); with ``stream_to`` every span is also
+    appended to that Chrome trace file as it finishes, so long runs keep a
+    full trace on disk without holding it in memory.
+    """
+
+    def __init__(self, max_spans=DEFAULT_MAX_SPANS, stream_to=None):
+        """Start an empty trace (and the streamed trace file, if any)"""
+        self.spans = deque(maxlen=max_spans)
+        self.dropped = 0
+        self._origin_ns = time.perf_counter_ns()
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._stream = None
+        self._streamed = 0
+        if stream_to is not None:
+            # JSON array format: viewers load it even without the closing bracket
+            self._stream = open(stream_to, "w", encoding="utf-8")
+            self._stream.write("[")
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """Time the enclosed block as a child of the current span"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        span = {
+            "id": next(self._ids),
+            "parent": stack[-1]["id"] if stack else None,
+            "name": name,
+            "thread": threading.get_ident(),
+            "start_ns": time.perf_counter_ns() - self._origin_ns,
+            "duration_ns": 0,
+            "attrs": attrs
+        }
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span["duration_ns"] = time.perf_counter_ns() - self._origin_ns - span["start_ns"]
+            stack.pop()
+            with self._lock:
+                if len(self.spans) == self.spans.maxlen:
+                    self.dropped += 1
+                self.spans.append(span)
+                if self._stream is not None and not self._stream.closed:
+                    self._stream.write(("\n" if not self._streamed else ",\n")
+                                       + json.dumps(self._chrome_event(span)))
+                    self._streamed += 1
+
+    def _chrome_event(self, span):
+        return {
+            "name": span["name"],
+            "cat": "login-test",
+            "ph": "X",
+            "ts": span["start_ns"] / 1000,
+            "dur": span["duration_ns"] / 1000,
+            "pid": self._pid,
+            "tid": span["thread"],
+            "args": span["attrs"]
+        }
+
+    def close(self):
+        """Finish the streamed trace file, leaving it a complete JSON array"""
+        with self._lock:
+            if self._stream is not None and not self._stream.closed:
+                self._stream.write("\n]\n")
+                self._stream.close()
+
+    def export_json(self, filename="test_spans.json"):
+        """Write the raw spans, ordered by start time"""
+        with open(filename, 'w') as f:
+            json.dump(sorted(self.spans, key=lambda span: span["start_ns"]), f, indent=2)
+
+    def export_chrome_trace(self, filename="test_trace.json"):
+        """Write the retained spans in Chrome trace-event format (chrome://tracing, Perfetto)"""
+        events = [self._chrome_event(span) for span in sorted(self.spans, key=lambda span: span["start_ns"])]
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if self.dropped:
+            trace["otherData"] = {"dropped_spans": self.dropped}
+        with open(filename, 'w') as f:
+            json.dump(trace, f)
+
@@ -0,0 +1,102 @@
+# Task 2: Smart Wait Strategies
+# Adaptive polling, fail-fast conditions and per-wait timing telemetry
+
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+# Resources a login check never needs: images, web fonts and analytics beacons
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*",
+    "*doubleclick.net*", "*hotjar.com*", "*segment.io*"
+]
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+def block_unneeded_resources(driver, patterns=BLOCKED_URL_PATTERNS):
+    """Ask Chrome (via DevTools) not to fetch resources matching the patterns"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except Exception:
+        # Not a Chromium driver, or DevTools unavailable
+        return False
+
+
+class AdaptiveWait:
+    """
+    Drop-in replacement for WebDriverWait with adaptive polling
+
+    Polling starts at ``initial_poll`` so fast conditions return almost
+    immediately, then backs off geometrically up to ``max_poll`` to avoid
+    hammering the browser during slow loads. Every wait can be recorded
+    into a telemetry list as {"condition", "duration", "polls", "outcome"}.
+    """
+
+    def __init__(self, driver, timeout=10, initial_poll=0.05, max_poll=0.5, backoff=1.5):
+        """Configure the default timeout and the polling schedule (seconds)"""
+        self.driver = driver
+        self.timeout = timeout
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+
+    def until(self, condition, label="condition", timeout=None, record=None):
+        """Wait for a single condition; returns its truthy value"""
+        _, value = self.until_any({label: condition}, timeout=timeout, record=record)
+        return value
+
+    def until_any(self, conditions, timeout=None, record=None, fail_fast=()):
+        """
+        Wait until any of ``conditions`` (label -> callable) is truthy
+
+        Returns (label, value) of the first satisfied condition. Labels in
+        ``fail_fast`` name counter-evidence conditions: when one of them is
+        met the wait stops early with a TimeoutException instead of burning
+        the whole timeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        label = " | ".join(conditions)
+        interval = self.initial_poll
+        polls = 0
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        while True:
+            polls += 1
+            for name, condition in conditions.items():
+                try:
+                    value = condition(self.driver)
+                except IGNORED_EXCEPTIONS:
+                    continue
+                if value:
+                    if name in fail_fast:
+                        self._record(record, label, start, polls, f"fail_fast:{name}")
+                        raise TimeoutException(f"Failed fast: {name} observed while waiting for {label}")
+                    self._record(record, label, start, polls, "met")
+                    return name, value
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                self._record(record, label, start, polls, "timeout")
+                raise TimeoutException(f"Timed out after {timeout}s waiting for {label}")
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll)
+
+    @staticmethod
+    def _record(record, label, start, polls, outcome):
+        if record is not None:
+            record.append({
+                "condition": label,
+                "duration": time.perf_counter() - start,
+                "polls": polls,
+                "outcome": outcome
+            })
@@ -0,0 +1,184 @@
+# Task 3: Incremental Training
+# Updates the priority models chunk by chunk from a JSON Lines stream of newly labeled issues
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from task3_predictive_analytics import DEFAULT_MODEL_PARAMS, PRIORITY_LABELS, load_dataset
+
+DEFAULT_CHUNK_SIZE = 50
+DEFAULT_TREES_PER_CHUNK = 10
+CLASSES = np.arange(len(PRIORITY_LABELS))
+
+
+def write_labeled_jsonl(path, X, y):
+    """Write ``{"features": [...], "label": "high"|"low"}`` records, one per line"""
+    with open(path, 'w') as f:
+        for row, label in zip(X, y):
+            f.write(json.dumps({"features": row.tolist(), "label": PRIORITY_LABELS[label]}) + "\n")
+
+
+def iter_labeled_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield (X, y) arrays of up to ``chunk_size`` labeled records
+
+    Labels may be priority names or class indices; blank lines are skipped.
+    """
+    label_index = {label: i for i, label in enumerate(PRIORITY_LABELS)}
+    features, labels = [], []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            features.append(record["features"])
+            label = record["label"]
+            labels.append(label_index[label] if isinstance(label, str) else int(label))
+            if len(labels) == chunk_size:
+                yield np.array(features, dtype=np.float64), np.array(labels)
+                features, labels = [], []
+    if labels:
+        yield np.array(features, dtype=np.float64), np.array(labels)
+
+
+class IncrementalPriorityModel:
+    """
+    Priority models that learn from each new chunk without revisiting history
+
+    - The StandardScaler statistics are updated with ``partial_fit``.
+    - The Random Forest grows ``trees_per_chunk`` new trees on each chunk
+      (``warm_start``); with ``max_trees`` set the oldest trees are retired,
+      so the ensemble tracks recent data at a bounded size. Trees are
+      invariant to feature scaling, so the forest sees raw features and its
+      existing trees stay valid while the scaling statistics move.
+    - An SGD logistic regression is updated with ``partial_fit`` on the
+      scaled chunk, alongside the forest.
+
+    Each update costs time proportional to the chunk, not to the history.
+    """
+
+    def __init__(self, trees_per_chunk=DEFAULT_TREES_PER_CHUNK, max_trees=None, random_state=42):
+        """Start with empty models; nothing is fitted until the first chunk"""
+        self.trees_per_chunk = trees_per_chunk
+        self.max_trees = max_trees
+        self.scaler = StandardScaler()
+        self.forest = RandomForestClassifier(
+            **{**DEFAULT_MODEL_PARAMS, "n_estimators": 0, "warm_start": True, "random_state": random_state}
+        )
+        self.sgd = SGDClassifier(loss="log_loss", random_state=random_state)
+        self.samples_seen = 0
+        self.chunks_seen = 0
+
+    def partial_fit(self, X, y):
+        """Fold one chunk of labeled rows into every model"""
+        self.scaler.partial_fit(X)
+        self.sgd.partial_fit(self.scaler.transform(X), y, classes=CLASSES)
+
+        # A chunk without both classes would redefine the forest's classes_
+        if len(np.unique(y)) == len(CLASSES):
+            self.forest.n_estimators += self.trees_per_chunk
+            self.forest.fit(X, y)
+            if self.max_trees and len(self.forest.estimators_) > self.max_trees:
+                self.forest.estimators_ = self.forest.estimators_[-self.max_trees:]
+                self.forest.n_estimators = self.max_trees
+
+        self.samples_seen += len(y)
+        self.chunks_seen += 1
+        return self
+
+    @property
+    def forest_ready(self):
+        return bool(getattr(self.forest, "estimators_", None))
+
+    def predict(self, X, model="forest"):
+        """Class indices from the forest (default) or the SGD model"""
+        if model == "sgd":
+            return self.sgd.predict(self.scaler.transform(X))
+        return self.forest.predict(X)
+
+
+def full_refit(X, y, params=None):
+    """Train a fresh forest on the whole history (the baseline being replaced)"""
+    return RandomForestClassifier(**{**DEFAULT_MODEL_PARAMS, **(params or {})}).fit(X, y)
+
+
+def compare_with_full_refit(path, X_test, y_test, chunk_size=DEFAULT_CHUNK_SIZE, refit_every=1,
+                            model=None):
+    """
+    Stream ``path`` through an incremental model, refitting from scratch on
+    the full history every ``refit_every`` chunks for comparison
+
+    Returns one row per chunk with the update time and test scores of the
+    incremental forest, the SGD model and (on refit chunks) the full refit.
+    """
+    model = model or IncrementalPriorityModel()
+    history_X, history_y = [], []
+    rows = []
+    for X, y in iter_labeled_chunks(path, chunk_size):
+        start = time.perf_counter()
+        model.partial_fit(X, y)
+        update_time = time.perf_counter() - start
+        history_X.append(X)
+        history_y.append(y)
+
+        row = {
+            "chunk": model.chunks_seen,
+            "samples_seen": model.samples_seen,
+            "incremental_time_s": update_time,
+            "sgd_f1": f1_score(y_test, model.predict(X_test, "sgd"), average="weighted")
+        }
+        if model.forest_ready:
+            row["forest_trees"] = len(model.forest.estimators_)
+            row["forest_f1"] = f1_score(y_test, model.predict(X_test), average="weighted")
+            row["forest_accuracy"] = accuracy_score(y_test, model.predict(X_test))
+
+        if model.chunks_seen % refit_every == 0:
+            start = time.perf_counter()
+            refit = full_refit(np.vstack(history_X), np.concatenate(history_y))
+            row["refit_time_s"] = time.perf_counter() - start
+            row["refit_f1"] = f1_score(y_test, refit.predict(X_test), average="weighted")
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incremental vs full-refit training for Task 3")
+    parser.add_argument("--stream", help="JSON Lines file of labeled records (default: simulated arrivals)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--trees-per-chunk", type=int, default=DEFAULT_TREES_PER_CHUNK)
+    parser.add_argument("--max-trees", type=int, default=None)
+    parser.add_argument("--refit-every", type=int, default=1)
+    args = parser.parse_args()
+
+    X, y, _ = load_dataset()
+    X_stream, X_test, y_stream, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        stream = args.stream
+        if stream is None:
+            # Simulate labeled issues arriving over time from the training split
+            stream = os.path.join(workdir, "labeled_issues.jsonl")
+            write_labeled_jsonl(stream, X_stream, y_stream)
+        rows = compare_with_full_refit(
+            stream, X_test, y_test,
+            chunk_size=args.chunk_size,
+            refit_every=args.refit_every,
+            model=IncrementalPriorityModel(args.trees_per_chunk, args.max_trees)
+        )
+
+    print("📈 Incremental training vs full refit")
+    print(f"{'chunk':>5} {'seen':>6} {'update':>9} {'forest F1':>10} {'SGD F1':>8} {'refit':>9} {'refit F1':>9}")
+    for row in rows:
+        print(f"{row['chunk']:>5} {row['samples_seen']:>6} {row['incremental_time_s'] * 1000:>7.0f}ms "
+              f"{row.get('forest_f1', float('nan')):>10.3f} {row['sgd_f1']:>8.3f} "
+              + (f"{row['refit_time_s'] * 1000:>7.0f}ms {row['refit_f1']:>9.3f}" if "refit_f1" in row else ""))
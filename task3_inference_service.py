@@ -0,0 +1,250 @@
+# Task 3: Priority Prediction Service
+# Scores issues online: one model loaded once, micro-batched predict_proba calls, latency counters
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from task2_stats import P2Quantile, RunningStats
+from task3_forest_export import CompactForest
+from task3_predictive_analytics import DEFAULT_ARTIFACT_FILE, PriorityPipeline, load_artifact
+
+DEFAULT_MAX_BATCH_SIZE = 256
+# How long the first request of a batch may wait for others to join it
+DEFAULT_MAX_LATENCY = 0.005
+
+
+class PriorityModelService:
+    """
+    Micro-batching front end for the exported priority model
+
+    The artifact is loaded once. sklearn copies tree nodes into its own
+    buffers on unpickling, so only the scaler's arrays stay memory-mapped;
+    pass ``forest_path`` (a CompactForest export) to score from flat node
+    arrays that are memory-mapped too and shared by processes. Callers on
+    any thread submit one row or a batch of rows; a single worker thread
+    gathers concurrent requests until ``max_batch_size`` rows are waiting or
+    the oldest request has waited ``max_latency`` seconds, then scores them
+    with one vectorized ``predict_proba`` call. Request latencies feed
+    streaming p50/p99 estimators.
+    """
+
+    def __init__(self, artifact_path=DEFAULT_ARTIFACT_FILE, max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+                 max_latency=DEFAULT_MAX_LATENCY, artifact=None, forest_path=None):
+        """Load the model (unless an ``artifact`` dict is given) and start the batching thread"""
+        artifact = artifact or load_artifact(artifact_path)
+        if forest_path is not None:
+            self.model = CompactForest.load(forest_path)
+        else:
+            self.model = artifact["model"]
+            # Joblib's per-call thread fan-out costs more than it saves on small batches
+            self.model.set_params(n_jobs=1)
+        self.scaler = artifact["scaler"]
+        self.labels = artifact["labels"]
+        self.n_features = len(artifact["feature_names"])
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+
+        self.latency = RunningStats()
+        self.latency_p50 = P2Quantile(0.5)
+        self.latency_p99 = P2Quantile(0.99)
+        self.batch_size = RunningStats()
+        self._stats_lock = threading.Lock()
+
+        self._queue = queue.Queue()
+        # Serializes submissions with close(), so nothing is queued behind the stop sentinel
+        self._submit_lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._serve, name="priority-batcher", daemon=True)
+        self._worker.start()
+
+    def predict(self, features, timeout=None):
+        """
+        Score one row (a flat list of features) or a batch (list of rows)
+
+        Returns ``{"priority", "probability_high"}`` for a single row and a
+        list of those for a batch. Raises RuntimeError once the service is
+        closed.
+        """
+        rows = np.asarray(features, dtype=np.float64)
+        single = rows.ndim == 1
+        rows = np.atleast_2d(rows)
+        if rows.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features per row, got {rows.shape[1]}")
+
+        future = Future()
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("PriorityModelService is closed")
+            self._queue.put((rows, future, time.perf_counter()))
+        predictions = future.result(timeout)
+        return predictions[0] if single else predictions
+
+    def _serve(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            rows = len(first[0])
+            deadline = first[2] + self.max_latency
+            while rows < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)  # finish this batch, then stop
+                    break
+                batch.append(item)
+                rows += len(item[0])
+            self._run_batch(batch)
+
+    def _run_batch(self, batch):
+        try:
+            X = np.vstack([rows for rows, _, _ in batch])
+            probabilities = self.model.predict_proba(self.scaler.transform(X))
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        labels = [self.labels[i] for i in probabilities.argmax(axis=1)]
+        high = probabilities[:, 0].tolist()
+        finished = time.perf_counter()
+        offset = 0
+        for rows, future, enqueued in batch:
+            end = offset + len(rows)
+            future.set_result([
+                {"priority": labels[i], "probability_high": high[i]} for i in range(offset, end)
+            ])
+            offset = end
+            with self._stats_lock:
+                elapsed = finished - enqueued
+                self.latency.add(elapsed)
+                self.latency_p50.add(elapsed)
+                self.latency_p99.add(elapsed)
+        with self._stats_lock:
+            self.batch_size.add(len(X))
+
+    def stats(self):
+        """Request count, batching efficiency and latency percentiles (ms)"""
+        with self._stats_lock:
+            return {
+                "requests": self.latency.count,
+                "batches": self.batch_size.count,
+                "rows": int(self.batch_size.total),
+                "mean_batch_size": self.batch_size.mean,
+                "latency_mean_ms": self.latency.mean * 1000,
+                "latency_p50_ms": self.latency_p50.value * 1000,
+                "latency_p99_ms": self.latency_p99.value * 1000,
+                "latency_max_ms": self.latency.max * 1000 if self.latency.count else 0
+            }
+
+    def close(self):
+        """Score whatever is queued, then stop the batching thread (idempotent)"""
+        with self._submit_lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(None)
+        self._worker.join()
+        # Only left behind if the worker died early; fail them rather than leave callers waiting
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].set_exception(RuntimeError("PriorityModelService closed before scoring the request"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    """POST /predict with {"features": row or rows}; GET /metrics for latency counters"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/metrics"):
+            self._send_json(200, self.server.service.stats())
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if not self.path.startswith("/predict"):
+            self._send_json(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length))
+            predictions = self.server.service.predict(request["features"])
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except RuntimeError as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        self._send_json(200, {"predictions": predictions})
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep service output quiet"""
+
+
+def start_inference_server(service, host="127.0.0.1", port=0):
+    """Serve ``service`` on a background thread; returns (server, predict URL)"""
+    server = ThreadingHTTPServer((host, port), PredictionHandler)
+    server.daemon_threads = True
+    server.service = service
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/predict"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local priority prediction service")
+    parser.add_argument("--artifact", default=DEFAULT_ARTIFACT_FILE)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument("--max-latency-ms", type=float, default=DEFAULT_MAX_LATENCY * 1000)
+    parser.add_argument("--forest", help="score with a CompactForest export (memory-mapped)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.artifact):
+        pipeline = PriorityPipeline()
+        pipeline.run()
+        pipeline.save_artifact(args.artifact)
+        print(f"Trained and exported the model to {args.artifact}")
+
+    service = PriorityModelService(args.artifact, max_batch_size=args.max_batch_size,
+                                   max_latency=args.max_latency_ms / 1000, forest_path=args.forest)
+    server = ThreadingHTTPServer((args.host, args.port), PredictionHandler)
+    server.service = service
+    print(f"Priority predictions at http://{args.host}:{args.port}/predict "
+          f"(metrics at /metrics)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+        service.close()
@@ -0,0 +1,178 @@
+# Task 3: Hyperparameter Tuning
+# Parallel successive-halving search, then an accuracy vs inference-latency trade-off report
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401 (enables the import below)
+from sklearn.metrics import f1_score
+from sklearn.model_selection import HalvingGridSearchCV, StratifiedKFold
+
+from task3_predictive_analytics import DEFAULT_MODEL_PARAMS, PriorityPipeline, train_model
+
+DEFAULT_PARAM_GRID = {
+    "n_estimators": [25, 50, 100, 200],
+    "max_depth": [None, 5, 10],
+    "min_samples_split": [2, 5],
+    "max_features": ["sqrt", 0.5]
+}
+
+# Candidates within this much weighted F1 of the best count as equally accurate
+DEFAULT_F1_TOLERANCE = 0.01
+
+
+def measure_latency(model, X, single_repeats=50, batch_repeats=5):
+    """Median single-row predict_proba latency (s) and batch throughput (rows/s)"""
+    row = X[:1]
+    model.predict_proba(row)  # warm up
+    single = []
+    for _ in range(single_repeats):
+        start = time.perf_counter()
+        model.predict_proba(row)
+        single.append(time.perf_counter() - start)
+
+    batch = []
+    for _ in range(batch_repeats):
+        start = time.perf_counter()
+        model.predict_proba(X)
+        batch.append(time.perf_counter() - start)
+    return statistics.median(single), len(X) / statistics.median(batch)
+
+
+def _shared_arrays(arrays, workdir):
+    """
+    The arrays as read-only memory maps, which joblib hands to worker
+    processes by file name instead of pickling a copy to each one
+
+    Arrays loaded from a warm pipeline cache are memory-mapped already;
+    anything else is dumped to ``workdir`` once and mapped back.
+    """
+    shared = []
+    for i, array in enumerate(arrays):
+        if not isinstance(array, np.memmap):
+            path = os.path.join(workdir, f"array-{i}.joblib")
+            joblib.dump(np.asarray(array), path)
+            array = joblib.load(path, mmap_mode="r")
+        shared.append(array)
+    return shared
+
+
+def tune(pipeline=None, param_grid=None, factor=3, cv=5, n_jobs=-1, top=5,
+         f1_tolerance=DEFAULT_F1_TOLERANCE, random_state=42):
+    """
+    Search Random Forest hyperparameters and recommend the fastest accurate model
+
+    Successive halving evaluates every configuration on a small sample of
+    the training split, keeps the best ``1/factor`` and repeats with
+    ``factor`` times more samples, so weak configurations never see the
+    full data. Cross-validation folds run in parallel across ``n_jobs``
+    processes. The fold splits are computed once up front, reused by every
+    halving iteration, and the training split is passed to the workers as
+    memory-mapped arrays, so they read one shared copy instead of each
+    receiving its own.
+
+    The ``top`` survivors are then fitted on the full training split
+    (through the same cache, so repeated runs do not refit) and timed. The
+    recommendation is the candidate with the lowest single-row latency
+    among those within ``f1_tolerance`` of the best cross-validated F1;
+    the test split only reports each candidate's held-out F1 and takes no
+    part in the choice.
+    """
+    pipeline = pipeline or PriorityPipeline()
+    if pipeline.data is None:
+        pipeline.run()
+    data = pipeline.data
+
+    # Halving subsamples within these folds, so one split of the full
+    # training data serves every iteration
+    splits = list(StratifiedKFold(n_splits=cv, shuffle=True, random_state=random_state)
+                  .split(data["X_train"], data["y_train"]))
+    search = HalvingGridSearchCV(
+        RandomForestClassifier(random_state=random_state, n_jobs=1),
+        param_grid or DEFAULT_PARAM_GRID,
+        factor=factor,
+        resource="n_samples",
+        cv=splits,
+        scoring="f1_weighted",
+        n_jobs=n_jobs,
+        refit=False,
+        random_state=random_state
+    )
+    with tempfile.TemporaryDirectory(prefix="tuning-") as workdir:
+        X_shared, y_shared = _shared_arrays((data["X_train"], data["y_train"]), workdir)
+        start = time.perf_counter()
+        search.fit(X_shared, y_shared)
+        search_time = time.perf_counter() - start
+        del X_shared, y_shared
+
+    results = search.cv_results_
+    final = np.flatnonzero(results["iter"] == results["iter"].max())
+    survivors = final[np.argsort(results["mean_test_score"][final])[::-1][:top]]
+
+    candidates = []
+    fit_model = pipeline.memory.cache(train_model)
+    for index in survivors:
+        params = {**DEFAULT_MODEL_PARAMS, **results["params"][index], "n_jobs": 1,
+                  "random_state": random_state}
+        model = fit_model(data["X_train"], data["y_train"], params)
+        latency, throughput = measure_latency(model, data["X_test"])
+        candidates.append({
+            "params": results["params"][index],
+            "cv_f1": float(results["mean_test_score"][index]),
+            "test_f1": f1_score(data["y_test"], model.predict(data["X_test"]), average="weighted"),
+            "latency_ms": latency * 1000,
+            "throughput_rows_per_s": throughput
+        })
+
+    best_f1 = max(candidate["cv_f1"] for candidate in candidates)
+    recommended = min(
+        (candidate for candidate in candidates if candidate["cv_f1"] >= best_f1 - f1_tolerance),
+        key=lambda candidate: candidate["latency_ms"]
+    )
+    return {
+        "search": {
+            "configurations": int(search.n_candidates_[0]),
+            "iterations": int(search.n_iterations_),
+            "resources_per_iteration": [int(n) for n in search.n_resources_],
+            "candidates_per_iteration": [int(n) for n in search.n_candidates_],
+            "elapsed_s": search_time
+        },
+        "candidates": candidates,
+        "recommended": recommended
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tune the Task 3 Random Forest")
+    parser.add_argument("--factor", type=int, default=3)
+    parser.add_argument("--cv", type=int, default=5)
+    parser.add_argument("--jobs", type=int, default=-1)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--f1-tolerance", type=float, default=DEFAULT_F1_TOLERANCE)
+    args = parser.parse_args()
+
+    report = tune(factor=args.factor, cv=args.cv, n_jobs=args.jobs, top=args.top,
+                  f1_tolerance=args.f1_tolerance)
+    search = report["search"]
+    print(f"🔍 Successive halving over {search['configurations']} configurations "
+          f"in {search['elapsed_s']:.1f}s")
+    for iteration, (resources, count) in enumerate(zip(search["resources_per_iteration"],
+                                                       search["candidates_per_iteration"])):
+        print(f"   Iteration {iteration}: {count} candidates on {resources} samples")
+
+    print("\n📊 Accuracy vs inference latency (top survivors)")
+    for candidate in report["candidates"]:
+        print(f"   CV F1 {candidate['cv_f1']:.3f} (test {candidate['test_f1']:.3f})  "
+              f"{candidate['latency_ms']:.2f} ms/row  "
+              f"{candidate['throughput_rows_per_s']:,.0f} rows/s  {candidate['params']}")
+
+    recommended = report["recommended"]
+    print(f"\n✅ Recommended: {recommended['params']} "
+          f"(CV F1 {recommended['cv_f1']:.3f}, test F1 {recommended['test_f1']:.3f}, "
+          f"{recommended['latency_ms']:.2f} ms/row)")
@@ -0,0 +1,87 @@
+import asyncio
+import os
+
+import pytest
+
+from task2_http_runner import AsyncHTTPLoginRunner, _read_response
+from task2_result_model import PASSED
+from task2_scenarios import expand_scenarios, load_scenarios
+from task2_stub_login_server import start_stub_server
+
+SCENARIO_FILE = os.path.join(os.path.dirname(__file__), "login_scenarios.json")
+
+
+@pytest.fixture
+def login_url():
+    server, url = start_stub_server()
+    yield url
+    server.shutdown()
+
+
+def http_cases(url):
+    return [{**case, "mode": "http"} for case in expand_scenarios(load_scenarios(SCENARIO_FILE), url)]
+
+
+def by_prefix(results, prefix):
+    return [result for result in results if result["name"].startswith(prefix)]
+
+
+def test_login_outcomes(login_url):
+    results = AsyncHTTPLoginRunner(concurrency=4).run(http_cases(login_url))
+
+    for prefix in ("Valid Credentials", "Invalid Credentials", "Empty Fields",
+                   "SQL Injection Prevention", "XSS Prevention"):
+        matching = by_prefix(results, prefix)
+        assert matching, prefix
+        assert all(result["status"] == PASSED for result in matching), matching
+    assert len(by_prefix(results, "SQL Injection Prevention")) == 5
+    assert len(by_prefix(results, "XSS Prevention")) == 4
+
+
+def test_wrong_expectations_fail(login_url):
+    valid, invalid = http_cases(login_url)[:2]
+    # Swap the expectations: the valid login redirects, the invalid one does not
+    cases = [{**valid, "expect": invalid["expect"]}, {**invalid, "expect": valid["expect"]}]
+
+    results = AsyncHTTPLoginRunner().run(cases)
+
+    assert [result["status"] for result in results] == ["FAILED", "FAILED"]
+    assert "not found" in results[0]["error"]
+    assert "Expected redirect" in results[1]["error"]
+
+
+def test_stop_when_skips_cases_not_started(login_url):
+    cases = http_cases(login_url)
+    started = []
+
+    results = AsyncHTTPLoginRunner(concurrency=1).run(
+        cases, on_start=started.append, stop_when=lambda test_case: True
+    )
+
+    assert results[0] is not None
+    assert results[1:] == [None] * (len(cases) - 1)
+    assert len(started) == 1
+
+
+def test_connections_are_reused(login_url):
+    cases = http_cases(login_url)
+    runner = AsyncHTTPLoginRunner(concurrency=1)
+
+    runner.run(cases)
+
+    assert runner.counters == {"connections_opened": 1, "requests": len(cases)}
+
+
+@pytest.mark.parametrize("status", [204, 304])
+def test_bodiless_response_without_content_length(status):
+    async def read():
+        reader = asyncio.StreamReader()
+        # The connection stays open: reading to EOF would never return
+        reader.feed_data(f"HTTP/1.1 {status} Nothing\r\nServer: stub\r\n\r\n".encode())
+        return await asyncio.wait_for(_read_response(reader), 1)
+
+    response, keep_alive = asyncio.run(read())
+
+    assert response.status == status
+    assert response.body == b""
+    assert keep_alive
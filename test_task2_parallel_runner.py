@@ -0,0 +1,88 @@
+import json
+import os
+
+from task2_automated_testing import AILoginTester
+from task2_parallel_runner import ParallelTestScheduler
+from task2_session_pool import BrowserSessionPool
+from task2_stub_login_server import start_stub_server
+
+SCENARIO_FILE = os.path.join(os.path.dirname(__file__), "login_scenarios.json")
+
+
+class CountingTester:
+    created = []
+
+    def __init__(self):
+        self.cleaned_up = False
+        CountingTester.created.append(self)
+
+    def double(self, value):
+        return value * 2
+
+    def cleanup(self):
+        self.cleaned_up = True
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for sessions to be pooled; every lookup fails"""
+
+    current_url = "about:blank"
+
+    def get(self, url):
+        self.current_url = url
+
+    def find_element(self, by, value):
+        raise RuntimeError("no such element")
+
+    def find_elements(self, by, value):
+        return []
+
+    def delete_all_cookies(self):
+        pass
+
+    def execute_script(self, script, *args):
+        pass
+
+    def execute_cdp_cmd(self, command, params):
+        pass
+
+    def quit(self):
+        pass
+
+
+def test_runs_share_workers_until_shutdown():
+    CountingTester.created = []
+    scheduler = ParallelTestScheduler(workers=2, tester_factory=CountingTester)
+    for _ in range(3):
+        results = scheduler.run([("double", (i,)) for i in range(20)], shutdown=False)
+        assert results == [i * 2 for i in range(20)]
+    assert 1 <= len(CountingTester.created) <= 2
+
+    scheduler.shutdown()
+    assert all(tester.cleaned_up for tester in CountingTester.created)
+
+
+def test_browser_segments_reuse_worker_sessions(tmp_path):
+    server, url = start_stub_server()
+    try:
+        with open(SCENARIO_FILE) as f:
+            scenarios = json.load(f)
+        browser = {**scenarios["scenarios"][0], "mode": "browser"}
+        http = {**scenarios["scenarios"][3], "mode": "http"}
+        # browser, http, browser, http, browser: three browser segments
+        scenarios["scenarios"] = [
+            {**case, "name": f"{case['name']} {i}"} for i, case in enumerate([browser, http] * 2 + [browser])
+        ]
+        scenario_file = tmp_path / "scenarios.json"
+        scenario_file.write_text(json.dumps(scenarios))
+
+        pool = BrowserSessionPool(FakeDriver, max_idle=4)
+        tester = AILoginTester(session_pool=pool)
+        results = tester.run_test_suite(url, workers=2, scenario_file=str(scenario_file))
+        tester.cleanup()
+    finally:
+        server.shutdown()
+
+    assert results["total_tests"] == 3 + 2 * 5
+    # The suite's own session plus at most one per worker, not one per worker per segment
+    assert pool.stats()["launches"] <= 3